@@ -1,10 +1,18 @@
 """Configuration module for DateSpot Aggregator"""
 import os
 import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """Load environment variables from the .env file once per process"""
+    return load_dotenv()
+
+
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 class ConfigError(Exception):
     """Custom exception for configuration errors"""
@@ -22,6 +30,8 @@ class Config:
     # Supabase Configuration
     SUPABASE_URL = os.getenv('SUPABASE_URL')
     SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+    SUPABASE_TIMEOUT = 30  # seconds per cache query
+    SUPABASE_PAGE_SIZE = 1000  # rows per page when loading the cache tables
     
     @classmethod
     def validate_required_env_vars(cls):
@@ -71,18 +81,46 @@ Please set these environment variables by:
     BLOGTO_API_BASE = 'https://www.blogto.com/api/v2/events/'
     GOOGLE_MAPS_API_BASE = 'https://maps.googleapis.com/maps/api/geocode/json'
     WEATHER_API_BASE = 'https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline'
-    ANTHROPIC_API_BASE = 'https://api.anthropic.com/v1/messages'
     GITHUB_API_BASE = 'https://api.github.com/repos'
     
-    # Rate limiting settings (in seconds)
-    BLOGTO_REQUEST_DELAY = 5
-    GEOCODING_REQUEST_DELAY = 0.01  # 10ms as per n8n workflow
+    # Shared HTTP client settings
+    HTTP_MAX_CONNECTIONS = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+    HTTP_TIMEOUT = 30.0  # seconds, default per request
+    HTTP_CONNECT_TIMEOUT = 5.0
+    HTTP2_ENABLED = True  # needs the h2 package (httpx[http2]); bodies are gzip-encoded either way
+    
+    # Rate limiting settings
+    BLOGTO_CONCURRENCY = 4  # date requests in flight at once
+    GEOCODING_CONCURRENCY = 10  # requests in flight; keeps well under Google's 50 QPS limit
     
     # Event filtering
     EXCLUDED_CATEGORIES = [
         "Camps & Kids Programs",
         "Seniors Programs"
     ]
+    EXCLUDED_CATEGORIES_SET = frozenset(EXCLUDED_CATEGORIES)
+    
+    # Title phrases that mark an event as obviously in an excluded category.
+    # Matching events are dropped before geocoding, weather and AI categorization;
+    # the category filter still catches everything else after categorization.
+    # Only unambiguous phrases belong here: bare words like "kids" or "seniors"
+    # also appear in adult event titles ("Kids in the Hall", "No Kids Allowed")
+    EXCLUDED_TITLE_KEYWORDS = [
+        "for kids",
+        "for children",
+        "kids camp",
+        "kids' camp",
+        "toddler",
+        "toddlers",
+        "preschool",
+        "storytime",
+        "day camp",
+        "summer camp",
+        "march break camp",
+        "for seniors",
+        "older adults"
+    ]
     
     # Required fields for event validation
     REQUIRED_FIELDS = [
@@ -101,9 +139,65 @@ Please set these environment variables by:
     
     # AI Model Configuration
     ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
-    ANTHROPIC_MAX_TOKENS = 64000
+    # Events are categorized by the fast model first; the ones it is unsure
+    # about (or skips) are sent to the strong model in one follow-up pass
+    ANTHROPIC_MODEL_FAST = "claude-haiku-4-5-20251001"
+    ANTHROPIC_MODEL_STRONG = ANTHROPIC_MODEL
+    ANTHROPIC_ESCALATION_CONFIDENCE = 0.7  # fast-model answers below this are escalated
+    ANTHROPIC_MAX_TOKENS = 64000  # upper bound; requests are sized to their event count
+    ANTHROPIC_BASE_OUTPUT_TOKENS = 128
+    ANTHROPIC_OUTPUT_TOKENS_PER_EVENT = 80
     ANTHROPIC_TEMPERATURE = 0.1
+    ANTHROPIC_REQUEST_TIMEOUT = 120  # seconds per direct request
+    ANTHROPIC_MAX_CONCURRENT_REQUESTS = 5  # direct requests in flight at once
+    ANTHROPIC_MAX_RETRIES = 4  # rate-limit and server-error retries per request
+    # Several dates share one request (and one system prompt) up to these limits
+    ANTHROPIC_PACK_MAX_CHARS = 240_000  # estimated payload characters (~60k input tokens)
+    ANTHROPIC_PACK_MAX_DATES = 16
+    # Multi-request runs write the cached system prompt once up front, then re-read it
+    # on this interval so it outlives the 5-minute cache TTL while requests queue
+    ANTHROPIC_CACHE_REFRESH_INTERVAL = 240  # seconds
+    # Shortest prompt (in tokens) each model will cache; a shorter system prompt is
+    # billed in full either way, so it gets no cache breakpoint and no warm-up calls
+    ANTHROPIC_MIN_CACHEABLE_TOKENS = {
+        "claude-haiku-4-5-20251001": 4096,
+        "claude-sonnet-4-20250514": 1024
+    }
+    ANTHROPIC_DEFAULT_MIN_CACHEABLE_TOKENS = 4096  # assumed for models not listed above
+    ANTHROPIC_CHARS_PER_TOKEN = 4  # rough estimate for sizing English prompt text
+    
+    # Title keywords that settle an event's category without an API call. An event
+    # is only labeled this way when its title matches exactly one category. Bare words
+    # that also appear in other kinds of titles ("Drag Racing", "Comedy Movie Night",
+    # "Improv Jazz") are left to the AI, so most entries are multi-word phrases.
+    CATEGORY_TITLE_KEYWORDS = {
+        "Comedy Scene": ["stand-up comedy", "standup comedy", "comedy show", "comedy night", "comedy open mic", "improv show"],
+        "Trivia & Quiz Nights": ["trivia", "pub quiz", "quiz night"],
+        "Fitness": ["yoga", "pilates", "zumba", "spin class", "run club"],
+        "Board Game Nights": ["board game", "board games"],
+        "Drag & Cabaret Shows": ["drag show", "drag brunch", "drag queen", "cabaret", "burlesque"],
+        "Farmers Markets & Food Markets": ["farmers market", "farmers' market", "farmer's market"],
+        "Escape Rooms & Immersive Games": ["escape room"],
+        "Walking & Bus Tours": ["walking tour", "bus tour"],
+        "Professional Networking": ["networking event", "networking mixer", "networking night"]
+    }
+    # Titles naming an audience skip the keyword shortcut: the AI decides whether they
+    # belong in Camps & Kids Programs or Seniors Programs, which are filtered out later
+    CATEGORY_AUDIENCE_KEYWORDS = [
+        "kid", "kids", "child", "children", "children's", "family", "families",
+        "teen", "teens", "youth", "junior", "toddler", "toddlers", "baby", "babies",
+        "preschool", "camp", "senior", "seniors", "older adults"
+    ]
+    
+    # Message Batches API (half-price, asynchronous) settings
+    ANTHROPIC_USE_BATCH_API = True
+    ANTHROPIC_BATCH_MIN_EVENTS = 100  # smaller runs use direct requests for lower latency
+    ANTHROPIC_BATCH_POLL_INTERVAL = 30  # seconds between batch status checks
+    ANTHROPIC_BATCH_MAX_WAIT = 3600  # give up and fall back to direct requests after an hour
     
     # Cache Configuration
-    GEOCODING_CACHE_TTL_DAYS = 90
+    # Geocoding entries are keyed by the normalized venue name, which is the whole
+    # geocoding input, so a changed venue is already a new key; the TTL is only a
+    # safety valve for venues that move
+    GEOCODING_CACHE_TTL_DAYS = 180
     CATEGORIZATION_CACHE_TTL_DAYS = 30
@@ -1,22 +1,14 @@
 """Main workflow orchestrator for DateSpot Aggregator"""
 import asyncio
 import sys
+import time
 from datetime import datetime
 from typing import Dict, Any
-import pytz
 
 # Local imports
 from config import Config, ConfigError
-from utils.logger import setup_logger
-from services.blogto_api import BlogTOAPI
-from processors.data_validator import DataValidator
-from services.geocoding import GeocodingService
-from services.weather import WeatherService
-from services.ai_categorizer import AICategorizer
-from processors.schema_merger import SchemaMerger
-from processors.filter import EventFilter
-from services.github_publisher import GitHubPublisher
-from services.supabase_cache import SupabaseCache
+from utils.logger import banner, setup_logger
+from utils.time_utils import TORONTO_TZ
 
 # Set up logging
 logger = setup_logger(__name__)
@@ -26,15 +18,39 @@ class DateSpotAggregator:
     """Main workflow orchestrator"""
     
     def __init__(self):
+        # Services are imported here rather than at module level so that a failed
+        # configuration check never pays for loading their third-party clients
+        from services.blogto_api import BlogTOAPI
+        from processors.data_validator import DataValidator
+        from services.geocoding import GeocodingService
+        from services.weather import WeatherService
+        from services.ai_categorizer import AICategorizer
+        from processors.schema_merger import SchemaMerger
+        from processors.filter import EventFilter
+        from services.github_publisher import GitHubPublisher
+        from services.supabase_cache import SupabaseCache
+        
+        # One cache serves geocoding and categorization, so each run loads the tables once
+        self.cache = SupabaseCache()
         self.blogto_api = BlogTOAPI()
         self.data_validator = DataValidator()
-        self.geocoding_service = GeocodingService()
+        self.geocoding_service = GeocodingService(self.cache)
         self.weather_service = WeatherService()
-        self.ai_categorizer = AICategorizer()
+        self.ai_categorizer = AICategorizer(self.cache)
         self.schema_merger = SchemaMerger()
         self.event_filter = EventFilter()
         self.github_publisher = GitHubPublisher()
-        self.cache = SupabaseCache()
+    
+    async def warm_caches(self) -> None:
+        """Reload the geocoding and categorization caches into memory for a new run"""
+        # The scheduler reuses one aggregator across runs, so start from a fresh load
+        self.cache.reset()
+        await self.cache.warmup()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool and the Anthropic client's pool"""
+        from services import http
+        await asyncio.gather(http.close(), self.ai_categorizer.close())
     
     async def run_workflow(self) -> Dict[str, Any]:
         """
@@ -43,157 +59,167 @@ class DateSpotAggregator:
         Returns:
             Final processed schema
         """
-        # Use Toronto timezone for all workflow timing
-        toronto_tz = pytz.timezone('America/Toronto')
-        workflow_start_time = datetime.now(toronto_tz)
-        logger.info("=" * 80)
-        logger.info("🚀 STARTING DATESPOT AGGREGATOR WORKFLOW")
-        logger.info(f"🕐 Start Time: {workflow_start_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        logger.info("=" * 80)
+        # Wall-clock time for log banners, monotonic clock for durations
+        workflow_start_time = datetime.now(TORONTO_TZ)
+        workflow_start = time.monotonic()
+        logger.info(banner(
+            "🚀 STARTING DATESPOT AGGREGATOR WORKFLOW",
+            f"🕐 Start Time: {workflow_start_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
+        ))
+        
+        categorization_task = None
+        
+        # Load the caches while BlogTO events are fetched, so geocoding starts hot
+        cache_warmup_task = asyncio.create_task(self.warm_caches())
         
         try:
             # Step 1: Fetch events from BlogTO
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 1/9: FETCHING EVENTS FROM BLOGTO")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info("   📋 Fetching events for the next 7 days with rate limiting...")
             
             raw_events = await self.blogto_api.fetch_all_events()
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
+            step_duration = time.monotonic() - step_start
             if not raw_events:
                 logger.error("   ❌ STEP 1 FAILED: No events fetched from BlogTO API")
                 return {}
             
-            total_raw_events = sum(len(events) for events in raw_events.values())
+            total_raw_events = sum(map(len, raw_events.values()))
             logger.info(f"   ✅ STEP 1 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Result: {total_raw_events} events across {len(raw_events)} dates")
             logger.info("-" * 60)
             
             # Step 2: Validate and clean data
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 2/9: VALIDATING AND CLEANING DATA")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
-            logger.info("   📋 Filtering events with required fields and adding numerical time...")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
+            logger.info("   📋 Filtering events with required fields, adding numerical time and excluding obvious kids/seniors events...")
             
-            validated_events = self.data_validator.validate_and_clean_data(raw_events)
+            validated_events, validation_stats = self.data_validator.validate_and_clean_data(raw_events)
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
             if not validated_events:
                 logger.error("   ❌ STEP 2 FAILED: No valid events after validation")
                 return {}
             
-            total_valid_events = sum(len(events) for events in validated_events.values())
+            # Drop events that are obviously in excluded categories before any paid API calls
+            validated_events, prefilter_stats = self.event_filter.prefilter_by_title(validated_events)
+            
+            step_duration = time.monotonic() - step_start
             logger.info(f"   ✅ STEP 2 COMPLETED in {step_duration:.1f}s")
-            logger.info(f"   📊 Result: {total_valid_events}/{total_raw_events} events passed validation")
+            logger.info(f"   📊 Result: {validation_stats.total_out}/{total_raw_events} events passed validation")
+            logger.info(f"   📊 Result: {prefilter_stats.extras['excluded']} events excluded by title before enrichment")
+            total_valid_events = prefilter_stats.total_out
             logger.info("-" * 60)
             
+            # AI categorization only needs validated event IDs, titles and descriptions,
+            # so start it now and let it overlap with geocoding and weather (steps 3-4)
+            categorization_start = time.monotonic()
+            logger.info("🔀 Starting AI categorization in the background (step 5 runs alongside steps 3-4)")
+            categorization_task = asyncio.create_task(
+                self.ai_categorizer.categorize_events(validated_events)
+            )
+            
             # Step 3: Add location coordinates
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 3/9: ADDING LOCATION COORDINATES")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info("   📋 Geocoding venue addresses using Google Maps API...")
             
-            geocoded_events = await self.geocoding_service.add_coordinates_to_events(validated_events)
+            geocoded_events, geocoding_stats = await self.geocoding_service.add_coordinates_to_events(validated_events)
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
-            # Count successful geocoding
-            geocoded_count = sum(
-                1 for date_events in geocoded_events.values() 
-                for event in date_events 
-                if event.get('location_coordinates')
-            )
+            step_duration = time.monotonic() - step_start
+            geocoded_count = geocoding_stats.extras['geocoded']
             logger.info(f"   ✅ STEP 3 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Result: {geocoded_count}/{total_valid_events} venues geocoded successfully")
             logger.info("-" * 60)
             
             # Step 4: Enrich with weather data
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 4/9: ENRICHING WITH WEATHER DATA")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info("   📋 Fetching weather data from Visual Crossing API...")
             
             weather_enriched_schema = await self.weather_service.add_weather_data(geocoded_events)
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
-            weather_count = len([w for w in weather_enriched_schema.get('weather_report_by_date', {}).values() if w and not w.get('error')])
+            step_duration = time.monotonic() - step_start
+            weather_report = weather_enriched_schema.get('weather_report_by_date', {})
+            weather_count = sum(1 for w in weather_report.values() if w and not w.get('error'))
             logger.info(f"   ✅ STEP 4 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Result: Weather data fetched for {weather_count}/{len(geocoded_events)} dates")
             logger.info("-" * 60)
             
             # Step 5: Categorize events with AI
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 5/9: CATEGORIZING EVENTS WITH AI")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
-            logger.info("   📋 Using Claude AI to categorize events into predefined categories...")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
+            logger.info("   📋 Waiting for Claude AI to finish categorizing events into predefined categories...")
             
-            categories = await self.ai_categorizer.categorize_events(geocoded_events)
+            categories = await categorization_task
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
-            categorized_count = sum(len(date_cats) for date_cats in categories.values())
-            logger.info(f"   ✅ STEP 5 COMPLETED in {step_duration:.1f}s")
+            step_duration = time.monotonic() - categorization_start
+            wait_duration = time.monotonic() - step_start
+            categorized_count = sum(map(len, categories.values()))
+            logger.info(f"   ✅ STEP 5 COMPLETED in {step_duration:.1f}s ({wait_duration:.1f}s after steps 3-4)")
             logger.info(f"   📊 Result: {categorized_count} events categorized by AI")
             logger.info("-" * 60)
             
             # Step 6: Merge schemas
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 6/9: MERGING EVENT DATA WITH CATEGORIES")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info("   📋 Combining event data with AI-generated categories...")
             
-            merged_schema = self.schema_merger.merge_events_with_categories(
+            merged_schema, merge_stats = self.schema_merger.merge_events_with_categories(
                 weather_enriched_schema, 
                 categories
             )
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
-            merged_count = sum(len(events) for events in merged_schema.get('results_by_date', {}).values())
-            with_categories = sum(
-                1 for date_events in merged_schema.get('results_by_date', {}).values()
-                for event in date_events
-                if event.get('event_category')
-            )
+            step_duration = time.monotonic() - step_start
+            merged_count = merge_stats.total_out
+            with_categories = merge_stats.extras['categorized']
             logger.info(f"   ✅ STEP 6 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Result: {with_categories}/{merged_count} events successfully categorized")
             logger.info("-" * 60)
             
             # Step 7: Filter unwanted categories
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 7/9: FILTERING UNWANTED CATEGORIES")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info(f"   📋 Removing events in excluded categories: {Config.EXCLUDED_CATEGORIES}")
             
-            filtered_schema = self.event_filter.filter_events_by_category(merged_schema)
+            filtered_schema, filter_stats = self.event_filter.filter_events_by_category(merged_schema)
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
-            filtered_count = sum(len(events) for events in filtered_schema.get('results_by_date', {}).values())
+            step_duration = time.monotonic() - step_start
+            filtered_count = filter_stats.total_out
             logger.info(f"   ✅ STEP 7 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Result: {filtered_count}/{merged_count} events after filtering")
             logger.info("-" * 60)
             
             # Step 8: Cache cleanup and statistics
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 8/9: CACHE CLEANUP AND STATISTICS")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info("   📋 Cleaning up expired cache entries and gathering statistics...")
             
             cleanup_stats = await self.cache.cleanup_expired_cache()
             cache_stats = await self.cache.get_cache_stats()
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
+            step_duration = time.monotonic() - step_start
             logger.info(f"   ✅ STEP 8 COMPLETED in {step_duration:.1f}s")
             logger.info(f"   📊 Cache stats: {cache_stats['total_active_entries']} active entries (geocoding: {cache_stats['active_geocoding_entries']}, categorization: {cache_stats['active_categorization_entries']})")
             logger.info("-" * 60)
             
             # Step 9: Publish to GitHub
-            step_start = datetime.now(toronto_tz)
+            step_start = time.monotonic()
             logger.info("🔵 STEP 9/9: PUBLISHING TO GITHUB")
-            logger.info(f"   ⏰ Step started at: {step_start.strftime('%H:%M:%S %Z')}")
+            logger.info(f"   ⏰ Step started at: {datetime.now(TORONTO_TZ).strftime('%H:%M:%S %Z')}")
             logger.info(f"   📋 Publishing schema to {Config.GITHUB_REPO}/{Config.GITHUB_FILE_PATH}")
             
             publish_success = await self.github_publisher.publish_to_github(filtered_schema)
             
-            step_duration = (datetime.now(toronto_tz) - step_start).total_seconds()
+            step_duration = time.monotonic() - step_start
             if publish_success:
                 logger.info(f"   ✅ STEP 9 COMPLETED in {step_duration:.1f}s")
                 logger.info("   📊 Result: Schema successfully published to GitHub")
@@ -202,27 +228,37 @@ class DateSpotAggregator:
                 logger.warning("   📊 Result: GitHub publication failed")
             
             # Final summary
-            total_duration = (datetime.now(toronto_tz) - workflow_start_time).total_seconds()
-            logger.info("=" * 80)
-            logger.info("🎉 WORKFLOW COMPLETED SUCCESSFULLY")
-            logger.info(f"🕐 Total Duration: {total_duration:.1f} seconds ({total_duration/60:.1f} minutes)")
-            logger.info(f"📊 Final Result: {filtered_count} events across {len(filtered_schema.get('results_by_date', {}))} dates")
-            logger.info("=" * 80)
+            total_duration = time.monotonic() - workflow_start
+            filtered_results = filtered_schema.get('results_by_date', {})
+            logger.info(banner(
+                "🎉 WORKFLOW COMPLETED SUCCESSFULLY",
+                f"🕐 Total Duration: {total_duration:.1f} seconds ({total_duration/60:.1f} minutes)",
+                f"📊 Final Result: {filtered_count} events across {len(filtered_results)} dates"
+            ))
             
             return filtered_schema
         
         except Exception as error:
-            total_duration = (datetime.now(toronto_tz) - workflow_start_time).total_seconds()
-            logger.error("=" * 80)
-            logger.error("💥 WORKFLOW FAILED")
-            logger.error(f"❌ Error: {error}")
-            logger.error(f"🕐 Failed after: {total_duration:.1f} seconds")
-            logger.error("=" * 80)
+            total_duration = time.monotonic() - workflow_start
+            logger.error(banner(
+                "💥 WORKFLOW FAILED",
+                f"❌ Error: {error}",
+                f"🕐 Failed after: {total_duration:.1f} seconds"
+            ))
             raise
+        
+        finally:
+            # Early returns and failures can leave background tasks running; cancel
+            # them and wait, so none outlives the run or is destroyed while pending
+            background_tasks = [task for task in (cache_warmup_task, categorization_task) if task is not None]
+            for task in background_tasks:
+                task.cancel()
+            await asyncio.gather(*background_tasks, return_exceptions=True)
 
 
 async def main():
     """Main entry point"""
+    aggregator = None
     try:
         # Validate configuration before starting
         logger.info("🔧 Validating configuration...")
@@ -235,8 +271,9 @@ async def main():
         
         # Print summary
         if result:
-            total_events = sum(len(events) for events in result.get('results_by_date', {}).values())
-            total_dates = len(result.get('results_by_date', {}))
+            final_results = result.get('results_by_date', {})
+            total_events = sum(map(len, final_results.values()))
+            total_dates = len(final_results)
             logger.info(f"📊 Final result: {total_events} events across {total_dates} dates")
         
         return 0
@@ -251,6 +288,9 @@ async def main():
     except Exception as error:
         logger.error(f"Unexpected error: {error}")
         return 1
+    finally:
+        if aggregator is not None:
+            await aggregator.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+-- Index the cache tables on expires_at so the start-up load
+-- (expires_at >= now), the active-entry counts and the expired-entry
+-- cleanup (expires_at < now) are index range scans instead of full scans.
+-- venue_name and event_id are already indexed by their unique constraints.
+
+CREATE INDEX IF NOT EXISTS geocoding_cache_expires_at_idx
+    ON geocoding_cache (expires_at);
+
+CREATE INDEX IF NOT EXISTS categorization_cache_expires_at_idx
+    ON categorization_cache (expires_at);
@@ -1,7 +1,10 @@
 """Event filtering processor"""
-from typing import Dict, List, Any
+import logging
+import re
+from typing import Dict, List, Any, Tuple
 from config import Config
 from utils.logger import setup_logger
+from utils.stats import ProcessingStats
 
 logger = setup_logger(__name__)
 
@@ -9,10 +12,56 @@ logger = setup_logger(__name__)
 class EventFilter:
     """Filters events based on category exclusions"""
     
+    __slots__ = ('excluded_categories', '_excluded', '_excluded_title_re')
+    
     def __init__(self):
         self.excluded_categories = Config.EXCLUDED_CATEGORIES
+        self._excluded = Config.EXCLUDED_CATEGORIES_SET
+        self._excluded_title_re = re.compile(
+            r'\b(?:' + '|'.join(re.escape(keyword) for keyword in Config.EXCLUDED_TITLE_KEYWORDS) + r')\b',
+            re.IGNORECASE
+        )
+    
+    def prefilter_by_title(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict[str, List[Dict[str, Any]]], ProcessingStats]:
+        """
+        Drop events whose titles clearly place them in an excluded category.
+        
+        This runs before geocoding, weather and AI categorization so that no API
+        calls are spent on events the category filter would remove anyway.
+        
+        Args:
+            results_by_date: Validated events data by date
+            
+        Returns:
+            Tuple of events data without obviously excluded events and prefilter stats
+        """
+        title_search = self._excluded_title_re.search
+        
+        prefiltered_results = {}
+        total_original = 0
+        total_kept = 0
+        
+        for date, events in results_by_date.items():
+            total_original += len(events)
+            kept_events = [event for event in events if not title_search(event.get('title') or '')]
+            
+            excluded_count = len(events) - len(kept_events)
+            if excluded_count > 0:
+                logger.info(f"   ✂️ {date}: {excluded_count} events excluded by title before enrichment")
+            
+            # Keep the date even if every event was excluded to preserve date structure
+            prefiltered_results[date] = kept_events
+            total_kept += len(kept_events)
+        
+        logger.info(f"Title prefilter complete: {total_kept}/{total_original} events kept")
+        
+        return prefiltered_results, ProcessingStats(
+            total_in=total_original,
+            total_out=total_kept,
+            extras={'excluded': total_original - total_kept}
+        )
     
-    def filter_events_by_category(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+    def filter_events_by_category(self, schema: Dict[str, Any]) -> Tuple[Dict[str, Any], ProcessingStats]:
         """
         Filter out events with excluded categories.
         
@@ -20,16 +69,19 @@ class EventFilter:
             schema: Schema with weather_report_by_date and results_by_date
             
         Returns:
-            Filtered schema with excluded categories removed
+            Tuple of filtered schema with excluded categories removed and filter stats
         """
         logger.info(f"Starting event filtering. Excluding categories: {self.excluded_categories}")
         
         results_by_date = schema.get('results_by_date', {})
         weather_data = schema.get('weather_report_by_date', {})
+        excluded = self._excluded
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         filtered_results = {}
         total_original = 0
         total_filtered = 0
+        total_excluded = 0
         
         # Process each date
         for date, events in results_by_date.items():
@@ -44,10 +96,11 @@ class EventFilter:
             for event in events:
                 event_category = event.get('event_category')
                 
-                if event_category in self.excluded_categories:
+                if event_category in excluded:
                     # Skip events in excluded categories
                     excluded_count += 1
-                    logger.debug(f"Excluding event {event.get('id')} with category: {event_category}")
+                    if debug_enabled:
+                        logger.debug("Excluding event %s with category: %s", event.get('id'), event_category)
                 elif event_category is None:
                     # Keep events without categories (they'll be handled later)
                     uncategorized_count += 1
@@ -56,6 +109,8 @@ class EventFilter:
                     # Keep events with valid categories
                     filtered_events.append(event)
             
+            total_excluded += excluded_count
+            
             # Always include the date if there are any events (don't drop dates entirely)
             if filtered_events:
                 filtered_results[date] = filtered_events
@@ -72,7 +127,13 @@ class EventFilter:
         
         logger.info(f"Event filtering complete: {total_filtered}/{total_original} events passed filter")
         
+        stats = ProcessingStats(
+            total_in=total_original,
+            total_out=total_filtered,
+            extras={'excluded': total_excluded}
+        )
+        
         return {
             'weather_report_by_date': weather_data,
             'results_by_date': filtered_results
-        }
+        }, stats
@@ -1,6 +1,8 @@
 """Schema merger for combining events with categories"""
-from typing import Dict, List, Any
+import logging
+from typing import Dict, List, Any, Tuple
 from utils.logger import setup_logger
+from utils.stats import ProcessingStats
 
 logger = setup_logger(__name__)
 
@@ -8,20 +10,52 @@ logger = setup_logger(__name__)
 class SchemaMerger:
     """Merges event data with AI-generated categories"""
     
+    __slots__ = ()
+    
+    def _flatten_categories(self, categories_data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """
+        Flatten categorization data into a direct {event_id: category} mapping per date.
+        
+        Args:
+            categories_data: Categorization data by date, either {event_id: category}
+                or [{event_id: category}, ...] per date
+            
+        Returns:
+            Mapping of date to {event_id: category}
+        """
+        category_lookup = {}
+        
+        for date, date_categories in categories_data.items():
+            if isinstance(date_categories, dict):
+                # Direct mapping: {event_id: category}
+                category_lookup[date] = date_categories
+            elif isinstance(date_categories, list):
+                # Array of objects: [{event_id: category}, ...] - first match wins
+                merged = {}
+                for category_item in date_categories:
+                    if isinstance(category_item, dict):
+                        for event_id, category in category_item.items():
+                            merged.setdefault(event_id, category)
+                category_lookup[date] = merged
+        
+        return category_lookup
+    
     def merge_events_with_categories(
         self, 
         events_data: Dict[str, Any],
         categories_data: Dict[str, Dict[str, str]]
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], ProcessingStats]:
         """
         Merge events data with categorization data.
         
         Args:
-            events_data: Schema with weather_report_by_date and results_by_date
+            events_data: Schema with weather_report_by_date and results_by_date;
+                every event must carry a string 'id' (guaranteed by DataValidator)
             categories_data: Categorization data by date and event ID
             
         Returns:
-            Merged schema with event_category added to each event
+            Tuple of merged schema with event_category added to each event
+            (events are updated in place) and merge stats
         """
         logger.info("Starting schema merge process...")
         
@@ -40,59 +74,52 @@ class SchemaMerger:
         total_events = 0
         categorized_events = 0
         
+        # Normalize every date's categories to a single {event_id: category} lookup up front
+        category_lookup = self._flatten_categories(categories_data)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         # Iterate through each date in the events data
         for date, events in events_results.items():
-            merged_results[date] = []
             total_events += len(events)
             
             logger.info(f"   📅 Processing {len(events)} events for {date}")
             
             # Check if we have categories for this date
-            date_has_categories = date in categories_data and categories_data[date]
-            if not date_has_categories:
+            date_categories = category_lookup.get(date, {})
+            if not date_categories:
                 logger.warning(f"   ⚠️ No categories found for {date}, events will have null categories")
             
             # Process each event for this date
             for event in events:
-                # Create a copy of the event
-                merged_event = event.copy()
-                event_id = str(event.get('id', ''))
-                
-                logger.debug(f"Looking for category for event ID: {event_id}")
+                event_id = event['id']
                 
                 # Look for the category using the event ID
-                event_category = None
-                
-                # Check if we have categories data for this date
-                if date_has_categories:
-                    date_categories = categories_data[date]
-                    
-                    # Handle different data structures
-                    if isinstance(date_categories, dict):
-                        # Direct mapping: {event_id: category}
-                        event_category = date_categories.get(event_id)
-                    elif isinstance(date_categories, list):
-                        # Array of objects: [{event_id: category}, ...]
-                        for category_item in date_categories:
-                            if isinstance(category_item, dict) and event_id in category_item:
-                                event_category = category_item[event_id]
-                                break
+                event_category = date_categories.get(event_id)
                 
+                # Events are fresh dicts from the validator, so they are updated in place
                 if event_category:
-                    merged_event['event_category'] = event_category
+                    event['event_category'] = event_category
                     categorized_events += 1
-                    logger.debug(f"Found category for {event_id}: {event_category}")
+                    if debug_enabled:
+                        logger.debug("Found category for %s: %s", event_id, event_category)
                 else:
-                    merged_event['event_category'] = None
-                    logger.debug(f"No category found for event ID {event_id}")
-                
-                # Always include the event, even without a category
-                merged_results[date].append(merged_event)
+                    event['event_category'] = None
+                    if debug_enabled:
+                        logger.debug("No category found for event ID %s", event_id)
+            
+            # Always include every event, even without a category
+            merged_results[date] = events
         
         logger.info(f"Schema merge complete: {categorized_events}/{total_events} events categorized")
         
+        stats = ProcessingStats(
+            total_in=total_events,
+            total_out=total_events,
+            extras={'categorized': categorized_events}
+        )
+        
         # Return the merged result
         return {
             'weather_report_by_date': weather_data,
             'results_by_date': merged_results
-        }
+        }, stats
@@ -1,89 +1,134 @@
 """Scheduler for running DateSpot Aggregator at regular intervals"""
 import asyncio
-import schedule
 import time
-from datetime import datetime
-import pytz
+from datetime import datetime, timedelta
+from functools import lru_cache
 from main import DateSpotAggregator
 from config import Config, ConfigError
-from utils.logger import setup_logger
+from utils.logger import banner, setup_logger
+from utils.time_utils import TORONTO_TZ
+
+try:
+    import uvloop
+except ImportError:  # Not installed (e.g. on Windows); use the default event loop
+    uvloop = None
 
 logger = setup_logger(__name__)
 
+# Daily run time, Toronto local time
+RUN_HOUR = 2
+RUN_MINUTE = 0
+
+
+@lru_cache(maxsize=1)
+def get_aggregator() -> DateSpotAggregator:
+    """Create the aggregator once so its API clients and connection pools are reused across runs"""
+    return DateSpotAggregator()
+
+
+def next_run_time(now: datetime) -> datetime:
+    """
+    Get the next scheduled run time after now.
+    
+    Args:
+        now: Current Toronto time
+        
+    Returns:
+        Next RUN_HOUR:RUN_MINUTE in Toronto time
+    """
+    next_run = now.replace(hour=RUN_HOUR, minute=RUN_MINUTE, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return next_run
+
 
 async def run_aggregator_job():
     """Run the aggregator workflow as a scheduled job"""
-    toronto_tz = pytz.timezone('America/Toronto')
-    job_start_time = datetime.now(toronto_tz)
+    job_start_time = datetime.now(TORONTO_TZ)
     
     try:
-        logger.info("=" * 80)
-        logger.info("🕐 SCHEDULED DATESPOT AGGREGATOR RUN")
-        logger.info(f"🕐 Started at: {job_start_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        logger.info("=" * 80)
+        logger.info(banner(
+            "🕐 SCHEDULED DATESPOT AGGREGATOR RUN",
+            f"🕐 Started at: {job_start_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
+        ))
         
         # Validate configuration before starting
         logger.info("🔧 Validating configuration...")
         Config.validate_required_env_vars()
         logger.info("✅ Configuration validation passed")
         
-        aggregator = DateSpotAggregator()
+        aggregator = get_aggregator()
         result = await aggregator.run_workflow()
         
-        job_duration = (datetime.now(toronto_tz) - job_start_time).total_seconds()
+        job_duration = (datetime.now(TORONTO_TZ) - job_start_time).total_seconds()
         
         if result:
-            total_events = sum(len(events) for events in result.get('results_by_date', {}).values())
-            total_dates = len(result.get('results_by_date', {}))
-            logger.info("=" * 80)
-            logger.info("✅ SCHEDULED RUN COMPLETED SUCCESSFULLY")
-            logger.info(f"📊 Result: {total_events} events across {total_dates} dates")
-            logger.info(f"⏱️ Total time: {job_duration:.1f} seconds ({job_duration/60:.1f} minutes)")
-            logger.info("=" * 80)
+            final_results = result.get('results_by_date', {})
+            total_events = sum(map(len, final_results.values()))
+            total_dates = len(final_results)
+            logger.info(banner(
+                "✅ SCHEDULED RUN COMPLETED SUCCESSFULLY",
+                f"📊 Result: {total_events} events across {total_dates} dates",
+                f"⏱️ Total time: {job_duration:.1f} seconds ({job_duration/60:.1f} minutes)"
+            ))
         else:
-            logger.warning("=" * 80)
-            logger.warning("⚠️ SCHEDULED RUN COMPLETED WITH NO RESULTS")
-            logger.warning(f"⏱️ Total time: {job_duration:.1f} seconds")
-            logger.warning("=" * 80)
+            logger.warning(banner(
+                "⚠️ SCHEDULED RUN COMPLETED WITH NO RESULTS",
+                f"⏱️ Total time: {job_duration:.1f} seconds"
+            ))
     
     except ConfigError as error:
-        job_duration = (datetime.now(toronto_tz) - job_start_time).total_seconds()
-        logger.error("=" * 80)
-        logger.error("❌ SCHEDULED RUN FAILED - CONFIGURATION ERROR")
-        logger.error(str(error))
-        logger.error(f"⏱️ Failed after: {job_duration:.1f} seconds")
-        logger.error("=" * 80)
+        job_duration = (datetime.now(TORONTO_TZ) - job_start_time).total_seconds()
+        logger.error(banner(
+            "❌ SCHEDULED RUN FAILED - CONFIGURATION ERROR",
+            str(error),
+            f"⏱️ Failed after: {job_duration:.1f} seconds"
+        ))
     except Exception as error:
-        job_duration = (datetime.now(toronto_tz) - job_start_time).total_seconds()
-        logger.error("=" * 80)
-        logger.error("❌ SCHEDULED RUN FAILED")
-        logger.error(f"💥 Error: {error}")
-        logger.error(f"⏱️ Failed after: {job_duration:.1f} seconds")
-        logger.error("=" * 80)
-
+        job_duration = (datetime.now(TORONTO_TZ) - job_start_time).total_seconds()
+        logger.error(banner(
+            "❌ SCHEDULED RUN FAILED",
+            f"💥 Error: {error}",
+            f"⏱️ Failed after: {job_duration:.1f} seconds"
+        ))
 
-def schedule_job():
-    """Wrapper to run async job in sync context"""
-    asyncio.run(run_aggregator_job())
 
-
-def main():
-    """Main scheduler entry point"""
-    logger.info("🚀 Starting DateSpot Aggregator Scheduler")
-    logger.info("📅 Scheduled to run daily at 2:00 AM")
-    
-    # Schedule the job to run daily at 2:00 AM
-    schedule.every().day.at("02:00").do(schedule_job)
+async def run_scheduler():
+    """Run the job now, then daily at the scheduled time, on one long-lived event loop"""
+    # Start tasks eagerly so ones that finish without suspending (e.g. cache hits)
+    # skip an event-loop round trip; available from Python 3.12
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
     
     # Also run immediately on startup (optional)
     logger.info("🔄 Running initial execution...")
-    schedule_job()
+    await run_aggregator_job()
     
     # Keep the scheduler running
     logger.info("⏰ Scheduler is now running. Waiting for scheduled times...")
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    try:
+        while True:
+            next_run = next_run_time(datetime.now(TORONTO_TZ))
+            logger.info(f"⏰ Next run at {next_run.strftime('%Y-%m-%d %H:%M %Z')}")
+            # Compare POSIX timestamps so the wait is correct across DST changes
+            await asyncio.sleep(max(0.0, next_run.timestamp() - time.time()))
+            await run_aggregator_job()
+    finally:
+        if get_aggregator.cache_info().currsize:
+            await get_aggregator().close()
+
+
+def main():
+    """Main scheduler entry point"""
+    logger.info("🚀 Starting DateSpot Aggregator Scheduler")
+    logger.info(f"📅 Scheduled to run daily at {RUN_HOUR}:{RUN_MINUTE:02d} AM")
+    
+    # uvloop has lower per-task and socket overhead than the default event loop
+    if uvloop is not None:
+        uvloop.run(run_scheduler())
+    else:
+        asyncio.run(run_scheduler())
 
 
 if __name__ == "__main__":
@@ -1,53 +1,168 @@
 """AI categorization service using Claude API"""
+import asyncio
+import codecs
 import json
 import re
-from typing import Dict, List, Any
-import requests
+from functools import lru_cache
+from hashlib import blake2b
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from config import Config
+from utils import json_utils
 from utils.logger import setup_logger
 from services.supabase_cache import SupabaseCache
 
 logger = setup_logger(__name__)
 
+def _replace_with_space(error: UnicodeError) -> Tuple[str, int]:
+    """Codec error handler that turns each run of non-ASCII characters into one space"""
+    # Only registered for encoding; any other codec error is not ours to handle
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+    return ' ', error.end
+
+
+codecs.register_error('ai_categorizer.space', _replace_with_space)
+
+
+@lru_cache(maxsize=8192)
+def _cleanse_text(text: str) -> str:
+    """Cleanse one description; memoized because each is cleansed for the cache key and again for the payload"""
+    # Replace non-ASCII characters (emojis, non-English characters) with spaces
+    # in one C-level codec pass; plain ASCII text skips it entirely
+    if not text.isascii():
+        text = text.encode('ascii', 'ai_categorizer.space').decode('ascii')
+    
+    # Collapse newlines and runs of whitespace to single spaces, trim,
+    # and limit to 250 characters
+    return ' '.join(text.split())[:250]
+
 
 class AICategorizer:
     """Service for categorizing events using Claude AI"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[SupabaseCache] = None):
         self.api_key = Config.ANTHROPIC_API_KEY
-        self.base_url = Config.ANTHROPIC_API_BASE
-        self.model = Config.ANTHROPIC_MODEL
+        self.model_fast = Config.ANTHROPIC_MODEL_FAST
+        self.model_strong = Config.ANTHROPIC_MODEL_STRONG
         self.max_tokens = Config.ANTHROPIC_MAX_TOKENS
         self.temperature = Config.ANTHROPIC_TEMPERATURE
-        self.cache = SupabaseCache()
-        
-        # Event categories from the n8n workflow
-        self.categories = [
-            "Comedy Scene",
-            "Trivia & Quiz Nights",
-            "Live Music Performances", 
-            "Theatre Productions",
-            "Dance Classes & Socials",
-            "Museum Exhibitions",
-            "Camps & Kids Programs",
-            "Farmers Markets & Food Markets",
-            "Movie Screenings",
-            "Fitness",
-            "Walking & Bus Tours",
-            "Interactive Dining Experiences",
-            "Escape Rooms & Immersive Games",
-            "Cultural Festivals",
-            "Craft Workshops",
-            "Sports Leagues & Activities",
-            "Drag & Cabaret Shows",
-            "Language & Cultural Exchange",
-            "Professional Networking",
-            "Seniors Programs",
-            "Art Gallery Openings",
-            "Patio & Rooftop Events",
-            "Board Game Nights"
+        self.use_batch_api = Config.ANTHROPIC_USE_BATCH_API
+        self.batch_poll_interval = Config.ANTHROPIC_BATCH_POLL_INTERVAL
+        self.batch_max_wait = Config.ANTHROPIC_BATCH_MAX_WAIT
+        self.request_timeout = Config.ANTHROPIC_REQUEST_TIMEOUT
+        # The SDK retries 429/5xx responses with exponential backoff, honouring retry-after
+        # HTTP/2 lets the concurrent chunk requests share one multiplexed connection
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            max_retries=Config.ANTHROPIC_MAX_RETRIES,
+            http_client=DefaultAsyncHttpxClient(http2=Config.HTTP2_ENABLED)
+        )
+        # Bounds how many direct requests are in flight at once
+        self._request_semaphore = asyncio.Semaphore(Config.ANTHROPIC_MAX_CONCURRENT_REQUESTS)
+        # The aggregator passes in the cache it shares between services
+        self.cache = cache or SupabaseCache()
+        
+        # Event categories from the n8n workflow, with guidance on what belongs in each
+        self.categories = {
+            "Comedy Scene": "stand-up sets, improv and sketch shows, comedy open mics, roasts and comedy club showcases",
+            "Trivia & Quiz Nights": "pub trivia, themed quiz nights, music bingo, game-show style competitions held at bars or venues",
+            "Live Music Performances": "concerts, gigs, DJ sets, jazz and blues nights, orchestras, choirs, music festivals and album release shows",
+            "Theatre Productions": "plays, musicals, opera, ballet and contemporary dance performances, fringe and staged readings",
+            "Dance Classes & Socials": "salsa, bachata, swing, tango or line-dancing lessons and socials, dance parties with instruction",
+            "Museum Exhibitions": "museum shows, science centre and history exhibits, special collections and museum after-hours events",
+            "Camps & Kids Programs": "day camps, March break and summer camps, children's classes, storytimes and family programs aimed at kids",
+            "Farmers Markets & Food Markets": "farmers markets, night markets, food halls, vendor markets, food festivals built around stalls",
+            "Movie Screenings": "film screenings, outdoor movie nights, film festivals, repertory cinema, premieres and Q&A screenings",
+            "Fitness": "yoga, pilates, run clubs, bootcamps, spin, dance fitness and other workout classes or wellness sessions",
+            "Walking & Bus Tours": "guided walking tours, ghost walks, architecture and neighbourhood tours, bus, bike and boat tours",
+            "Interactive Dining Experiences": "tasting menus, chef's tables, wine, beer or cocktail tastings, supper clubs, dinner shows, cooking classes",
+            "Escape Rooms & Immersive Games": "escape rooms, murder mysteries, immersive theatre and art experiences, scavenger hunts, VR and arcade events",
+            "Cultural Festivals": "heritage and cultural celebrations, parades, street festivals, holiday festivals and community fairs",
+            "Craft Workshops": "hands-on making: pottery, painting, candle making, knitting, printmaking, floral design and DIY classes",
+            "Sports Leagues & Activities": "recreational leagues, pickup games, climbing, skating, bowling, golf, watch parties and pro sports games",
+            "Drag & Cabaret Shows": "drag shows and brunches, cabaret, burlesque, variety and vaudeville-style performances",
+            "Language & Cultural Exchange": "language meetups and conversation circles, cultural talks, book clubs, lectures and discussion groups",
+            "Professional Networking": "networking mixers, industry meetups, career fairs, startup pitches, conferences and professional panels",
+            "Seniors Programs": "programs designed for older adults and seniors, including seniors' fitness, social and learning groups",
+            "Art Gallery Openings": "gallery openings and vernissages, art exhibitions, artist talks, art fairs and studio open houses",
+            "Patio & Rooftop Events": "patio parties, rooftop bars and socials, outdoor drinks events, beer gardens and summer lounges",
+            "Board Game Nights": "board game cafes and nights, tabletop and card game meetups, role-playing game sessions, chess clubs"
+        }
+        
+        # (pattern, category) rules for titles that need no API call
+        self._keyword_rules = [
+            (
+                re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b', re.IGNORECASE),
+                category
+            )
+            for category, keywords in Config.CATEGORY_TITLE_KEYWORDS.items()
+        ]
+        self._audience_re = re.compile(
+            r'\b(?:' + '|'.join(re.escape(keyword) for keyword in Config.CATEGORY_AUDIENCE_KEYWORDS) + r')\b',
+            re.IGNORECASE
+        )
+        
+        # The system prompt never changes, so build it once; prompt caching also
+        # requires the cached prefix to be byte-identical across requests
+        category_list = '\n'.join(f'- {category}: {guide}' for category, guide in self.categories.items())
+        self._system_prompt = f"""You are an expert event categorization system. Your task is to categorize event descriptions into exactly one of these categories (the text after each colon describes what belongs there and is not part of the category name):
+{category_list}
+
+Rules:
+1. Return ONLY the JSON structure maintaining the same unique ID keys from the input
+2. Each value must be exactly one of the categories above
+3. Maintain the exact same structure and order as the input
+4. CRITICAL: Process every single entry - do not skip any entries from the input data
+5. Take your time to ensure completeness - verify that your output has the same number of entries as the input
+6. If uncertain, choose the most likely category based on keywords and context
+7. Do not include any explanation or additional text
+8. Ensure the output is stringified JSON. Do not return markdown or any other format.
+9. Also include a top-level "low_confidence" array listing the IDs of any entries you are less than {Config.ANTHROPIC_ESCALATION_CONFIDENCE:.0%} confident about (an empty array if there are none)
+10. Judge each event by what attendees actually do there; the venue alone does not decide the category (a comedy show at a bar is Comedy Scene, not Patio & Rooftop Events)
+11. Events aimed at children or families with young kids are Camps & Kids Programs, and events aimed at older adults are Seniors Programs, whatever the activity
+
+Example input:
+{{"results_by_date": {{"2025-06-01": {{"101": "Tuesday Night Trivia: Teams of up to six compete for bar tabs", "102": "Wheel Throwing 101: Learn to centre clay and throw a bowl"}}}}}}
+
+Example output:
+{{"results_by_date": {{"2025-06-01": {{"101": "Trivia & Quiz Nights", "102": "Craft Workshops"}}}}, "low_confidence": []}}"""
+        self._system_prompt_tokens = len(self._system_prompt) // Config.ANTHROPIC_CHARS_PER_TOKEN
+        self._system_blocks = [
+            {
+                "type": "text",
+                "text": self._system_prompt
+            }
+        ]
+        # For models that can cache it, repeat calls bill the prompt at the cache-read rate
+        self._cached_system_blocks = [
+            {
+                "type": "text",
+                "text": self._system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
         ]
     
+    def _is_prompt_cacheable(self, model: str) -> bool:
+        """
+        Check whether the system prompt is long enough for a model to cache it.
+        
+        Args:
+            model: Model the prompt will be sent to
+            
+        Returns:
+            True if the prompt meets the model's minimum cacheable length
+        """
+        minimum = Config.ANTHROPIC_MIN_CACHEABLE_TOKENS.get(model, Config.ANTHROPIC_DEFAULT_MIN_CACHEABLE_TOKENS)
+        return self._system_prompt_tokens >= minimum
+    
+    async def close(self) -> None:
+        """Close the Anthropic client's HTTP connection pool"""
+        await self.client.close()
+    
     def cleanse_text(self, text: str) -> str:
         """
         Cleanse text for LLM processing.
@@ -61,19 +176,44 @@ class AICategorizer:
         if not text or not isinstance(text, str):
             return ''
         
-        # Remove newlines and replace with spaces
-        cleaned = text.replace('\n', ' ')
+        return _cleanse_text(text)
+    
+    def keyword_category(self, title: str) -> Optional[str]:
+        """
+        Categorize an event from its title alone when a keyword makes it obvious.
+        
+        Titles that name an audience (kids, families, seniors) are never labeled here,
+        so a kids' yoga class still reaches the AI and the excluded-category filter.
         
-        # Replace non-UTF8 characters (emojis, non-English characters) with spaces
-        cleaned = re.sub(r'[^\x00-\x7F]', ' ', cleaned)
+        Args:
+            title: Event title
+            
+        Returns:
+            The category if the title matches exactly one category's keywords and names
+            no audience, otherwise None
+        """
+        if not title or self._audience_re.search(title):
+            return None
         
-        # Replace multiple consecutive spaces with single space
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        matches = [category for pattern, category in self._keyword_rules if pattern.search(title)]
+        return matches[0] if len(matches) == 1 else None
+    
+    def content_cache_key(self, event: Dict[str, Any]) -> str:
+        """
+        Build a cache key from an event's title and cleansed description.
         
-        # Trim whitespace and limit to 250 characters
-        cleaned = cleaned.strip()[:250]
+        Recurring events (weekly trivia, standing comedy nights) get a new ID for
+        every occurrence but keep the same text, so keying on content lets them
+        reuse an earlier categorization.
         
-        return cleaned
+        Args:
+            event: Event with 'title' and 'description_stripped'
+            
+        Returns:
+            Key of the form 'content:<hash>'
+        """
+        content = f"{event['title']}\x1f{self.cleanse_text(event['description_stripped'])}"
+        return f"content:{blake2b(content.encode('utf-8'), digest_size=16).hexdigest()}"
     
     def create_reduced_payload(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Dict[str, str]]]:
         """
@@ -87,15 +227,18 @@ class AICategorizer:
         """
         logger.info("Creating reduced payload for LLM processing...")
         
-        reduced_payload = {"results_by_date": {}}
+        cleanse_text = self.cleanse_text
         
-        for date, events in results_by_date.items():
-            reduced_payload["results_by_date"][date] = {}
-            
-            for event in events:
-                event_id = str(event['id'])
-                event_description = f"{event['title']}: {self.cleanse_text(event['description_stripped'])}"
-                reduced_payload["results_by_date"][date][event_id] = event_description
+        # One flat {id: "title: description"} map per date
+        reduced_payload = {
+            "results_by_date": {
+                date: {
+                    event['id']: f"{event['title']}: {cleanse_text(event['description_stripped'])}"
+                    for event in events
+                }
+                for date, events in results_by_date.items()
+            }
+        }
         
         return reduced_payload
     
@@ -112,14 +255,20 @@ class AICategorizer:
         logger.info("Starting AI categorization process...")
         
         # Calculate total events and check cache
-        total_events = sum(len(events) for events in results_by_date.values())
+        total_events = sum(map(len, results_by_date.values()))
         logger.info(f"   📊 Total events to categorize: {total_events} across {len(results_by_date)} dates")
         
         # Check cache for each event and separate cached vs uncached
         cached_categories = {}
         events_to_categorize = {}
         cache_hits = 0
+        keyword_hits = 0
         
+        # Events with identical content are sent once; the rest reuse that event's category
+        representatives = {}  # content key -> (date, event ID) of the event sent to the API
+        duplicates = []  # (date, event ID, content key)
+        
+        lookups = []  # (date, event, event ID, content key) for events the keyword rules did not settle
         for date, events in results_by_date.items():
             cached_categories[date] = {}
             events_to_categorize[date] = []
@@ -127,80 +276,134 @@ class AICategorizer:
             for event in events:
                 event_id = event.get('id')
                 if event_id:
-                    cached_category = await self.cache.get_categorization_cache(event_id)
-                    if cached_category:
-                        cached_categories[date][event_id] = cached_category
-                        cache_hits += 1
+                    # Obvious titles are labeled locally and never reach the cache or the API
+                    keyword_category = self.keyword_category(event.get('title'))
+                    if keyword_category:
+                        cached_categories[date][event_id] = keyword_category
+                        keyword_hits += 1
                     else:
-                        events_to_categorize[date].append(event)
+                        lookups.append((date, event, event_id, self.content_cache_key(event)))
+        
+        # One bulk cache read for every content key and event ID
+        cache_keys = [content_key for _, _, _, content_key in lookups]
+        cache_keys.extend(event_id for _, _, event_id, _ in lookups)
+        cached = await self.cache.get_categorization_cache_bulk(cache_keys)
         
-        uncached_events = sum(len(events) for events in events_to_categorize.values())
-        logger.info(f"   📊 Cache results: {cache_hits} hits, {uncached_events} events need API categorization")
+        for date, event, event_id, content_key in lookups:
+            # Identical content from any earlier run first, then entries stored by event ID
+            cached_category = cached.get(content_key) or cached.get(event_id)
+            if cached_category:
+                cached_categories[date][event_id] = cached_category
+                cache_hits += 1
+            elif content_key in representatives:
+                duplicates.append((date, event_id, content_key))
+            else:
+                representatives[content_key] = (date, event_id)
+                events_to_categorize[date].append(event)
         
-        # If all events are cached, return cached results
+        uncached_events = sum(map(len, events_to_categorize.values()))
+        logger.info(f"   🔑 Keyword rules categorized {keyword_hits} events without an API call")
+        logger.info(f"   📊 Cache results: {cache_hits} hits, {uncached_events} events need API categorization ({len(duplicates)} duplicates reuse their results)")
+        
+        # If all events are cached or keyword-labeled, return those results
         if uncached_events == 0:
-            logger.info("   ✓ All events found in cache, no API calls needed!")
+            logger.info("   ✓ All events found in cache or labeled by keyword, no API calls needed!")
             return cached_categories
         
         # Process uncached events
         new_categories = {}
-        if uncached_events > 100:  # Arbitrary threshold to prevent token limit issues
-            logger.info("   🔄 Large uncached dataset detected, processing dates in batches...")
-            new_categories = await self._categorize_in_batches(events_to_categorize)
+        if self.use_batch_api and uncached_events >= Config.ANTHROPIC_BATCH_MIN_EVENTS:
+            logger.info("   📦 Submitting uncached events through the Message Batches API...")
+            new_categories = await self._categorize_with_batch_api(events_to_categorize)
+            
+            # Fall back to direct requests for any dates the batch did not return
+            remaining_events = {
+                date: events for date, events in events_to_categorize.items()
+                if events and date not in new_categories
+            }
+            if remaining_events:
+                logger.warning(f"   ⚠️ Batch returned no results for {len(remaining_events)} dates, retrying with direct requests...")
+                new_categories.update(await self._categorize_in_batches(remaining_events))
         else:
-            new_categories = await self._categorize_single_batch(events_to_categorize)
-        
-        # Merge cached and new categories
-        final_categories = {}
-        for date in results_by_date.keys():
-            final_categories[date] = {}
-            # Add cached categories
-            if date in cached_categories and isinstance(cached_categories[date], dict):
-                final_categories[date].update(cached_categories[date])
-            # Add new categories
-            if date in new_categories and isinstance(new_categories[date], dict):
-                final_categories[date].update(new_categories[date])
-        
-        return final_categories
+            # Small runs pack into a single request; larger ones are split to fit the token limits
+            new_categories = await self._categorize_in_batches(events_to_categorize)
+        
+        # Escalate low-confidence and skipped events to the strong model, packed and concurrent like the first pass
+        if self.model_fast != self.model_strong:
+            unresolved_events = self._collect_unresolved_events(events_to_categorize, new_categories)
+            if unresolved_events:
+                unresolved_count = sum(map(len, unresolved_events.values()))
+                logger.info(f"   ⬆️ Escalating {unresolved_count} low-confidence events to {self.model_strong}...")
+                escalated_categories = await self._categorize_in_batches(unresolved_events, model=self.model_strong)
+                for date, date_categories in escalated_categories.items():
+                    new_categories.setdefault(date, {}).update(date_categories)
+        
+        # Copy each representative's category to the events that share its content
+        for date, event_id, content_key in duplicates:
+            representative_date, representative_id = representatives[content_key]
+            representative_categories = new_categories.get(representative_date, {})
+            if representative_id in representative_categories:
+                new_categories.setdefault(date, {})[event_id] = representative_categories[representative_id]
+        
+        # Merge cached and new categories; every per-date value is a dict by construction
+        return {
+            date: {**cached_categories.get(date, {}), **new_categories.get(date, {})}
+            for date in results_by_date
+        }
     
-    async def _categorize_single_batch(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, str]]:
-        """Process all events in a single AI request"""
-        # Skip if no events to process
-        total_uncached_events = sum(len(events) for events in results_by_date.values())
-        if total_uncached_events == 0:
-            return {}
+    def _collect_unresolved_events(self, results_by_date: Dict[str, List[Dict[str, Any]]], categories: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the events that the first categorization pass left without a category.
         
-        logger.info(f"   ○ Cache MISS: Making Claude AI API call for {total_uncached_events} events")
+        Args:
+            results_by_date: Events sent to the fast model by date
+            categories: Categories it returned by date and event ID
+            
+        Returns:
+            Events still needing a category, by date
+        """
+        unresolved_events = {}
+        for date, events in results_by_date.items():
+            date_categories = categories.get(date, {})
+            pending = [event for event in events if event['id'] not in date_categories]
+            if pending:
+                unresolved_events[date] = pending
+        return unresolved_events
+    
+    def _build_request_payload(self, results_by_date: Dict[str, List[Dict[str, Any]]], model: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the Claude request for a set of events.
         
+        Args:
+            results_by_date: Events to categorize by date
+            model: Model to use; defaults to the fast model
+            
+        Returns:
+            Tuple of the Messages API request parameters and the reduced payload they contain
+        """
         # Create reduced payload
         reduced_payload = self.create_reduced_payload(results_by_date)
         
-        # Log payload size for debugging
-        payload_size = len(json.dumps(reduced_payload))
-        logger.info(f"   📊 Payload size: {payload_size} characters")
+        # Serialize once; the same body is logged and sent
+        body = json_utils.dumps(reduced_payload)
+        logger.info(f"   📊 Payload size: {len(body)} characters")
         
-        # Prepare system prompt
-        system_prompt = f"""You are an expert event categorization system. Your task is to categorize event descriptions into exactly one of these categories:
-{chr(10).join(f'- {cat}' for cat in self.categories)}
-
-Rules:
-1. Return ONLY the JSON structure maintaining the same unique ID keys from the input
-2. Each value must be exactly one of the categories above
-3. Maintain the exact same structure and order as the input
-4. CRITICAL: Process every single entry - do not skip any entries from the input data
-5. Take your time to ensure completeness - verify that your output has the same number of entries as the input
-6. If uncertain, choose the most likely category based on keywords and context
-7. Do not include any explanation or additional text
-8. Ensure the output is stringified JSON. Do not return markdown or any other format."""
+        user_content = f"Categorize this event data:\n\n{body}"
         
-        user_content = f"Categorize this event data:\n\n{json.dumps(reduced_payload)}"
+        # The answer is one short {id: category} entry per event, so cap the output budget to fit
+        event_count = sum(map(len, reduced_payload["results_by_date"].values()))
+        max_tokens = min(
+            self.max_tokens,
+            Config.ANTHROPIC_BASE_OUTPUT_TOKENS + Config.ANTHROPIC_OUTPUT_TOKENS_PER_EVENT * event_count
+        )
         
         # Prepare API request
+        model = model or self.model_fast
         payload = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
+            "model": model,
+            "max_tokens": max_tokens,
             "temperature": self.temperature,
-            "system": system_prompt,
+            "system": self._cached_system_blocks if self._is_prompt_cacheable(model) else self._system_blocks,
             "messages": [
                 {
                     "role": "user",
@@ -209,81 +412,222 @@ Rules:
             ]
         }
         
+        return payload, reduced_payload
+    
+    async def _categorize_single_batch(self, results_by_date: Dict[str, List[Dict[str, Any]]], model: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """Process all events in a single AI request"""
+        # Skip if no events to process
+        total_uncached_events = sum(map(len, results_by_date.values()))
+        if total_uncached_events == 0:
+            return {}
+        
+        logger.info(f"   ○ Cache MISS: Making Claude AI API call for {total_uncached_events} events")
+        
+        payload, reduced_payload = self._build_request_payload(results_by_date, model)
+        
         return await self._make_ai_request(payload, reduced_payload, results_by_date)
     
-    async def _categorize_in_batches(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, str]]:
-        """Process events in batches by date to avoid token limits"""
+    async def _categorize_with_batch_api(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, str]]:
+        """
+        Categorize events through the Message Batches API, one batch request per packed chunk of dates.
+        
+        Batched requests are billed at half the normal token price.
+        
+        Args:
+            results_by_date: Uncached events to categorize by date
+            
+        Returns:
+            Categories mapped by date and event ID; dates whose request did not succeed are omitted
+        """
+        batch_requests = []
+        request_data = {}
+        
+        for index, chunk in enumerate(self._pack_dates_into_chunks(results_by_date)):
+            custom_id = f"chunk-{index}"
+            logger.info(f"   📅 Adding batch request {custom_id} for {', '.join(chunk)} ({sum(map(len, chunk.values()))} events)")
+            payload, reduced_payload = self._build_request_payload(chunk)
+            request_data[custom_id] = (reduced_payload, chunk, payload['model'])
+            batch_requests.append(Request(
+                custom_id=custom_id,
+                params=MessageCreateParamsNonStreaming(**payload)
+            ))
+        
+        if not batch_requests:
+            return {}
+        
         all_categories = {}
         
-        # Process each date separately
+        try:
+            batch = await self.client.messages.batches.create(requests=batch_requests)
+            logger.info(f"   🤖 Submitted Message Batch {batch.id} with {len(batch_requests)} requests")
+            
+            batch = await self._wait_for_batch(batch.id)
+            if batch.processing_status != "ended":
+                logger.warning(f"   ⚠️ Message Batch {batch.id} did not finish within {self.batch_max_wait}s, cancelling")
+                await self.client.messages.batches.cancel(batch.id)
+                return {}
+            
+            async for entry in await self.client.messages.batches.results(batch.id):
+                custom_id = entry.custom_id
+                if entry.result.type != "succeeded":
+                    logger.warning(f"   ⚠️ Batch request {custom_id} {entry.result.type}")
+                    continue
+                
+                # A malformed entry only loses its own dates; they fall back to direct requests
+                try:
+                    logger.info(f"   ✓ Received batch categorization for {custom_id}")
+                    ai_response = entry.result.message.content[0].text
+                    reduced_payload, original_events, model = request_data[custom_id]
+                    categories = await self._process_ai_response(ai_response, reduced_payload, original_events, model)
+                except Exception as error:
+                    logger.error(f"   ❌ Error processing batch result {custom_id}: {error}")
+                    continue
+                
+                for date in original_events:
+                    if categories and date in categories:
+                        all_categories[date] = categories[date]
+                    else:
+                        logger.warning(f"   ⚠️ No categories returned for {date}")
+        
+        except Exception as error:
+            logger.error(f"   ❌ Error during batch AI categorization: {error}")
+        
+        return all_categories
+    
+    async def _wait_for_batch(self, batch_id: str) -> Any:
+        """Poll a Message Batch until it has ended or the maximum wait has passed"""
+        deadline = time.monotonic() + self.batch_max_wait
+        
+        while True:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended" or time.monotonic() >= deadline:
+                return batch
+            
+            counts = batch.request_counts
+            logger.info(f"   ⏳ Batch {batch_id} {batch.processing_status}: {counts.processing} processing, {counts.succeeded} succeeded, {counts.errored} errored")
+            await asyncio.sleep(self.batch_poll_interval)
+    
+    def _pack_dates_into_chunks(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Greedily pack whole dates into request-sized chunks.
+        
+        Sharing one request between several dates pays for the system prompt once
+        per chunk instead of once per date. A chunk is closed when adding the next
+        date would exceed ANTHROPIC_PACK_MAX_CHARS of estimated payload, or when it
+        already holds ANTHROPIC_PACK_MAX_DATES dates. A single oversized date still
+        gets a chunk of its own.
+        
+        Args:
+            results_by_date: Events to categorize by date
+            
+        Returns:
+            List of {date: events} chunks; dates without events are skipped
+        """
+        chunks = []
+        chunk = {}
+        chunk_chars = 0
+        
         for date, events in results_by_date.items():
-            logger.info(f"   📅 Processing batch for {date} ({len(events)} events)")
+            if not events:
+                continue
             
-            # Create payload for just this date
-            single_date_data = {date: events}
-            categories = await self._categorize_single_batch(single_date_data)
+            # Estimate the reduced payload: id, title and description (capped at 250 by cleanse_text)
+            date_chars = sum(
+                len(event['id']) + len(event['title']) + min(len(event['description_stripped'] or ''), 250) + 10
+                for event in events
+            )
+            if chunk and (chunk_chars + date_chars > Config.ANTHROPIC_PACK_MAX_CHARS
+                          or len(chunk) >= Config.ANTHROPIC_PACK_MAX_DATES):
+                chunks.append(chunk)
+                chunk = {}
+                chunk_chars = 0
             
-            # Merge results
-            if categories and date in categories:
-                all_categories[date] = categories[date]
-            else:
-                logger.warning(f"   ⚠️ No categories returned for {date}")
-                all_categories[date] = {}
+            chunk[date] = events
+            chunk_chars += date_chars
+        
+        if chunk:
+            chunks.append(chunk)
+        
+        return chunks
+    
+    async def _categorize_in_batches(self, results_by_date: Dict[str, List[Dict[str, Any]]], model: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """Process events in concurrent, packed multi-date batches to avoid token limits"""
+        all_categories = {}
+        
+        model = model or self.model_fast
+        chunks = self._pack_dates_into_chunks(results_by_date)
+        logger.info(f"   📦 Packed {len(results_by_date)} dates into {len(chunks)} requests")
+        for chunk in chunks:
+            logger.info(f"   📅 Processing batch for {', '.join(chunk)} ({sum(map(len, chunk.values()))} events)")
+        
+        # Concurrent first requests would each pay the cache write, so write it once first
+        refresher = None
+        if len(chunks) > 1 and self._is_prompt_cacheable(model):
+            await self._warm_prompt_cache(model)
+            refresher = asyncio.create_task(self._keep_prompt_cache_warm(model))
+        
+        # Requests run concurrently, bounded by the request semaphore
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(self._categorize_single_batch(chunk, model=model)) for chunk in chunks]
+        finally:
+            if refresher:
+                refresher.cancel()
+        
+        # Merge results
+        for chunk, task in zip(chunks, tasks):
+            categories = task.result()
+            for date in chunk:
+                if categories and date in categories:
+                    all_categories[date] = categories[date]
+                else:
+                    logger.warning(f"   ⚠️ No categories returned for {date}")
+                    all_categories[date] = {}
         
         return all_categories
     
+    async def _warm_prompt_cache(self, model: str) -> None:
+        """
+        Write (or refresh) the cached system prompt with a minimal one-token request.
+        
+        Args:
+            model: Model whose prompt cache to warm; caches are per model
+        """
+        try:
+            async with self._request_semaphore:
+                await self.client.messages.create(
+                    model=model,
+                    max_tokens=1,
+                    system=self._cached_system_blocks,
+                    messages=[{"role": "user", "content": "Ready?"}],
+                    timeout=self.request_timeout
+                )
+            logger.info(f"   🔥 Warmed prompt cache for {model}")
+        except Exception as error:
+            logger.warning(f"   ⚠️ Prompt cache warm-up failed: {error}")
+    
+    async def _keep_prompt_cache_warm(self, model: str) -> None:
+        """Refresh the prompt cache until cancelled, so it does not expire between queued requests"""
+        while True:
+            await asyncio.sleep(Config.ANTHROPIC_CACHE_REFRESH_INTERVAL)
+            await self._warm_prompt_cache(model)
+    
     async def _make_ai_request(self, payload: Dict[str, Any], reduced_payload: Dict[str, Any], original_events: Dict[str, List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """Make the actual AI request and parse response"""
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01"
-        }
-        
         try:
             logger.info("   🤖 Sending categorization request to Claude AI...")
-            logger.info(f"   📊 Request size: {len(json.dumps(payload))} characters")
             
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=120  # Increased timeout for AI processing
-            )
-            response.raise_for_status()
-            
-            response_data = response.json()
+            # Stream the response so long generations keep the connection active; the
+            # timeout then bounds the gap between chunks rather than the whole response
+            async with self._request_semaphore:
+                async with self.client.messages.stream(**payload, timeout=self.request_timeout) as stream:
+                    message = await stream.get_final_message()
             
             # Extract the categorized data
-            if 'content' in response_data and response_data['content']:
-                ai_response = response_data['content'][0]['text']
+            if message.content:
+                ai_response = message.content[0].text
                 logger.info("   ✓ Successfully received categorization from Claude AI")
-                logger.info(f"   📊 Response size: {len(ai_response)} characters")
-                
-                # Parse the JSON response
-                try:
-                    categorized_data = json.loads(ai_response)
-                    logger.info("   ✓ Successfully parsed AI categorization response")
-                    
-                    # Count categorized events and validate completeness
-                    ai_results = categorized_data.get('results_by_date', {})
-                    total_categorized = sum(len(date_data) for date_data in ai_results.values())
-                    total_input = sum(len(events) for events in reduced_payload.get('results_by_date', {}).values())
-                    
-                    logger.info(f"   📊 AI categorized {total_categorized}/{total_input} events")
-                    
-                    if total_categorized < total_input:
-                        logger.warning(f"   ⚠️ AI response incomplete: {total_categorized}/{total_input} events categorized")
-                    
-                    # Store successful categorizations in cache
-                    if original_events:
-                        await self._store_categorizations_in_cache(ai_results, original_events)
-                    
-                    return ai_results
-                except json.JSONDecodeError as e:
-                    logger.error(f"   ❌ Failed to parse AI response as JSON: {e}")
-                    logger.error(f"   📄 AI response: {ai_response[:500]}...")
-                    return {}
+                return await self._process_ai_response(ai_response, reduced_payload, original_events, payload['model'])
             else:
                 logger.error("   ❌ No content in AI response")
                 return {}
@@ -292,18 +636,77 @@ Rules:
             logger.error(f"   ❌ Error during AI categorization: {error}")
             return {}
     
+    async def _process_ai_response(self, ai_response: str, reduced_payload: Dict[str, Any], original_events: Optional[Dict[str, List[Dict[str, Any]]]] = None, model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse a categorization response, validate its completeness and cache the results.
+        
+        Low-confidence answers from the fast model are dropped (and not cached) so
+        they can be escalated to the strong model.
+        """
+        logger.info(f"   📊 Response size: {len(ai_response)} characters")
+        
+        # Parse the JSON response
+        try:
+            categorized_data = json_utils.loads(ai_response)
+            if not isinstance(categorized_data, dict) or not isinstance(categorized_data.get('results_by_date'), dict):
+                logger.error("   ❌ AI response is not a results_by_date object")
+                logger.error(f"   📄 AI response: {ai_response[:500]}...")
+                return {}
+            logger.info("   ✓ Successfully parsed AI categorization response")
+            
+            # Keep only well-formed per-date maps so callers can merge them without type checks
+            ai_results = {
+                date: date_categories
+                for date, date_categories in categorized_data['results_by_date'].items()
+                if isinstance(date_categories, dict)
+            }
+            
+            # Count categorized events and validate completeness
+            total_categorized = sum(map(len, ai_results.values()))
+            total_input = sum(map(len, reduced_payload.get('results_by_date', {}).values()))
+            
+            logger.info(f"   📊 AI categorized {total_categorized}/{total_input} events")
+            
+            if total_categorized < total_input:
+                logger.warning(f"   ⚠️ AI response incomplete: {total_categorized}/{total_input} events categorized")
+            
+            low_confidence = categorized_data.get('low_confidence') or []
+            if isinstance(low_confidence, list) and low_confidence and model != self.model_strong:
+                low_confidence_ids = set(map(str, low_confidence))
+                ai_results = {
+                    date: {
+                        event_id: category for event_id, category in date_categories.items()
+                        if event_id not in low_confidence_ids
+                    }
+                    for date, date_categories in ai_results.items()
+                }
+                logger.info(f"   📊 {len(low_confidence_ids)} low-confidence categorizations held back for escalation")
+            
+            # Store successful categorizations in cache
+            if original_events:
+                await self._store_categorizations_in_cache(ai_results, original_events)
+            
+            return ai_results
+        except json.JSONDecodeError as e:
+            logger.error(f"   ❌ Failed to parse AI response as JSON: {e}")
+            logger.error(f"   📄 AI response: {ai_response[:500]}...")
+            return {}
+    
     async def _store_categorizations_in_cache(self, ai_results: Dict[str, Dict[str, str]], original_events: Dict[str, List[Dict[str, Any]]]) -> None:
-        """Store AI categorization results in cache"""
+        """Store AI categorization results in cache, keyed by event content"""
         try:
-            stored_count = 0
+            to_store = {}
             for date, date_categories in ai_results.items():
+                events_by_id = {event['id']: event for event in original_events.get(date, [])}
                 for event_id, category in date_categories.items():
-                    success = await self.cache.set_categorization_cache(event_id, category)
-                    if success:
-                        stored_count += 1
+                    event = events_by_id.get(event_id)
+                    cache_key = self.content_cache_key(event) if event else event_id
+                    to_store[cache_key] = category
+            
+            # One bulk upsert instead of an insert (and possible update) per event
+            stored_count = await self.cache.set_categorization_cache_bulk(to_store)
             
-            total_categories = sum(len(date_cats) for date_cats in ai_results.values())
-            logger.info(f"   💾 Cached {stored_count}/{total_categories} new categorizations")
+            logger.info(f"   💾 Cached {stored_count}/{len(to_store)} new categorizations")
             
         except Exception as error:
             logger.warning(f"   ⚠️ Error storing categorizations in cache: {error}")
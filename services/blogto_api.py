@@ -2,10 +2,11 @@
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-import requests
-import pytz
 from config import Config
+from services import http
+from utils import json_utils
 from utils.logger import setup_logger
+from utils.time_utils import TORONTO_TZ
 
 logger = setup_logger(__name__)
 
@@ -15,7 +16,7 @@ class BlogTOAPI:
     
     def __init__(self):
         self.base_url = Config.BLOGTO_API_BASE
-        self.request_delay = Config.BLOGTO_REQUEST_DELAY
+        self.concurrency = Config.BLOGTO_CONCURRENCY
     
     def generate_dates(self, number_of_days: int) -> List[str]:
         """
@@ -27,18 +28,14 @@ class BlogTOAPI:
         Returns:
             List of date strings in YYYY-MM-DD format
         """
-        dates = []
-        
         # Get current time in Toronto timezone
-        toronto_tz = pytz.timezone('America/Toronto')
-        today = datetime.now(toronto_tz)
+        now = datetime.now(TORONTO_TZ)
         
-        logger.info(f"   🕐 Current Toronto time: {today.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        logger.info(f"   🕐 Current Toronto time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         
-        for i in range(number_of_days):
-            current_date = today + timedelta(days=i)
-            date_str = current_date.strftime('%Y-%m-%d')
-            dates.append(date_str)
+        # Step whole calendar days from Toronto's date; date.isoformat() is YYYY-MM-DD
+        today = now.date()
+        dates = [(today + timedelta(days=i)).isoformat() for i in range(number_of_days)]
         
         logger.info(f"   📅 Generated dates: {dates[0]} to {dates[-1]}")
         return dates
@@ -71,7 +68,7 @@ class BlogTOAPI:
             }
             
             # Make HTTP request
-            response = requests.get(
+            response = await http.get_client().get(
                 self.base_url,
                 params=params,
                 headers=headers,
@@ -79,7 +76,7 @@ class BlogTOAPI:
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = json_utils.loads(response.content)
             events = data.get('results', [])
             
             logger.info(f"Successfully fetched {len(events)} events for {date}")
@@ -89,10 +86,32 @@ class BlogTOAPI:
             logger.error(f"Error fetching events for {date}: {error}")
             return []
     
+    async def _fetch_date(self, date: str, position: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Fetch one date's events once a concurrency slot is free.
+        
+        Args:
+            date: Date string in YYYY-MM-DD format
+            position: Progress label for logging, e.g. "3/7"
+            semaphore: Limits how many BlogTO requests are in flight
+            
+        Returns:
+            List of event dictionaries
+        """
+        async with semaphore:
+            logger.info(f"   📅 Processing date {position}: {date}")
+            events = await self.fetch_events_for_date(date)
+        
+        logger.info(f"   ✓ Completed {date}: {len(events)} events fetched")
+        return events
+    
     async def fetch_all_events(self, number_of_days: int = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fetch events for multiple days with rate limiting.
         
+        Dates are fetched concurrently; Config.BLOGTO_CONCURRENCY bounds the
+        number of requests in flight.
+        
         Args:
             number_of_days: Number of days to fetch (defaults to Config.FETCH_DAYS)
             
@@ -103,22 +122,16 @@ class BlogTOAPI:
             number_of_days = Config.FETCH_DAYS
         
         dates = self.generate_dates(number_of_days)
-        results_by_date = {}
         
         logger.info(f"Starting to fetch events for {len(dates)} dates...")
         
-        for i, date in enumerate(dates):
-            logger.info(f"   📅 Processing date {i + 1}/{len(dates)}: {date}")
-            
-            # Wait between requests (skip delay for first request)
-            if i > 0:
-                logger.info(f'   ⏳ Waiting {self.request_delay} seconds for rate limiting...')
-                await asyncio.sleep(self.request_delay)
-            
-            # Fetch events for this date
-            events = await self.fetch_events_for_date(date)
-            results_by_date[date] = events
-            logger.info(f"   ✓ Completed {date}: {len(events)} events fetched")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        events_by_position = await asyncio.gather(*(
+            self._fetch_date(date, f"{i + 1}/{len(dates)}", semaphore)
+            for i, date in enumerate(dates)
+        ))
+        # gather keeps task order, so dates stay in chronological order
+        results_by_date = dict(zip(dates, events_by_position))
         
         logger.info('All BlogTO API requests completed!')
         return results_by_date
@@ -1,9 +1,11 @@
 """Google Maps Geocoding service"""
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple
-import requests
 from config import Config
+from services import http
+from utils import json_utils
 from utils.logger import setup_logger
+from utils.stats import ProcessingStats
 from services.supabase_cache import SupabaseCache
 
 logger = setup_logger(__name__)
@@ -12,16 +14,25 @@ logger = setup_logger(__name__)
 class GeocodingService:
     """Service for geocoding venue names using Google Maps API"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[SupabaseCache] = None):
         self.api_key = Config.GOOGLE_MAPS_API_KEY
         self.base_url = Config.GOOGLE_MAPS_API_BASE
-        self.request_delay = Config.GEOCODING_REQUEST_DELAY
-        self.cache = SupabaseCache()
+        self.concurrency = Config.GEOCODING_CONCURRENCY
+        # Bounds how many Google Maps requests are in flight; cache hits and callers
+        # waiting on a shared lookup never hold a slot
+        self._request_semaphore = asyncio.Semaphore(self.concurrency)
+        # The aggregator passes in the cache it shares between services
+        self.cache = cache or SupabaseCache()
+        # Normalized venue name -> lookup task, so each venue is resolved once per run
+        # even when many events at the same venue are geocoded concurrently
+        self._lookups: Dict[str, asyncio.Task] = {}
     
     async def geocode_venue(self, venue_name: str) -> Optional[Dict[str, float]]:
         """
         Geocode a venue using Google Maps API with caching.
         
+        Concurrent and repeated calls for the same venue share a single lookup.
+        
         Args:
             venue_name: Name of the venue to geocode
             
@@ -32,6 +43,16 @@ class GeocodingService:
             logger.warning("No venue name provided for geocoding")
             return None
         
+        key = venue_name.strip().lower()
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._lookup_venue(venue_name))
+            self._lookups[key] = lookup
+        # Shielded so one cancelled caller does not cancel the lookup the others are awaiting
+        return await asyncio.shield(lookup)
+    
+    async def _lookup_venue(self, venue_name: str) -> Optional[Dict[str, float]]:
+        """Resolve a venue from the persistent cache, falling back to the Google Maps API"""
         # Check cache first
         cached_coordinates = await self.cache.get_geocoding_cache(venue_name)
         if cached_coordinates:
@@ -54,15 +75,16 @@ class GeocodingService:
             }
             
             # Make HTTP request
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=headers,
-                timeout=10
-            )
+            async with self._request_semaphore:
+                response = await http.get_client().get(
+                    self.base_url,
+                    params=params,
+                    headers=headers,
+                    timeout=10
+                )
             response.raise_for_status()
             
-            data = response.json()
+            data = json_utils.loads(response.content)
             
             # Check response status
             if data.get('status') == 'OK' and data.get('results'):
@@ -75,8 +97,8 @@ class GeocodingService:
                     }
                     logger.info(f"Successfully geocoded {venue_name}: {coordinates}")
                     
-                    # Store in cache
-                    await self.cache.set_geocoding_cache(venue_name, coordinates)
+                    # Cache in memory now; written to Supabase in one batch after the run
+                    self.cache.queue_geocoding_cache(venue_name, coordinates)
                     
                     return coordinates
                 else:
@@ -92,54 +114,79 @@ class GeocodingService:
             logger.error(f"Geocoding error for {venue_name}: {error}")
             return None
     
-    async def add_coordinates_to_events(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    async def _geocode_event(self, event: Dict[str, Any], position: str) -> bool:
+        """
+        Geocode one event's venue and store the result on the event.
+        
+        Args:
+            event: Event to update with location_coordinates
+            position: Progress label for logging, e.g. "3/42"
+            
+        Returns:
+            True if coordinates were found
+        """
+        venue_name = event.get('venue_name')
+        
+        if not venue_name:
+            logger.warning(f"   ⚠️ No venue_name found in event {event.get('id', 'unknown')}")
+            event['location_coordinates'] = None
+            return False
+        
+        logger.info(f"   🏢 Geocoding venue {position}: \"{venue_name}\"")
+        
+        # Get coordinates from the cache or Google Maps
+        coordinates = await self.geocode_venue(venue_name)
+        
+        event['location_coordinates'] = coordinates
+        
+        if coordinates:
+            logger.info(f"   ✓ Success: {venue_name} → {coordinates['lat']:.4f}, {coordinates['lng']:.4f}")
+            return True
+        
+        logger.warning(f"   ✗ Failed: {venue_name}")
+        return False
+    
+    async def add_coordinates_to_events(self, results_by_date: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict[str, List[Dict[str, Any]]], ProcessingStats]:
         """
         Add location coordinates to all events.
         
+        Venues are geocoded concurrently; Config.GEOCODING_CONCURRENCY bounds the
+        number of requests in flight to stay under Google's QPS limit.
+        
         Args:
             results_by_date: Events data by date
             
         Returns:
-            Events data with location_coordinates added to each event
+            Tuple of events data with location_coordinates added to each event and geocoding stats
         """
         logger.info("Starting geocoding process...")
         
-        total_venues = 0
-        geocoded_venues = 0
+        # Start each run with fresh lookups so earlier failures are retried
+        self._lookups = {}
+        total_venues = sum(map(len, results_by_date.values()))
         
-        # Process each date
+        # Geocode every event across all dates at once
+        results = await asyncio.gather(*(
+            self._geocode_event(event, f"{i + 1}/{len(events)} for {date}")
+            for date, events in results_by_date.items()
+            for i, event in enumerate(events)
+        ))
+        
+        # Persist every newly geocoded venue in one request
+        await self.cache.flush()
+        
+        # Report per date; results are in the same date/event order as the tasks
+        geocoded_venues = 0
+        offset = 0
         for date, events in results_by_date.items():
-            logger.info(f"   📅 Processing {len(events)} venues for {date}")
-            total_venues += len(events)
-            
-            # Process each venue for this date
-            for i, event in enumerate(events):
-                venue_name = event.get('venue_name')
-                
-                if not venue_name:
-                    logger.warning(f"   ⚠️ No venue_name found in event {event.get('id', 'unknown')}")
-                    event['location_coordinates'] = None
-                    continue
-                
-                logger.info(f"   🏢 Geocoding venue {i + 1}/{len(events)}: \"{venue_name}\"")
-                
-                # Get coordinates from Google Maps
-                coordinates = await self.geocode_venue(venue_name)
-                event['location_coordinates'] = coordinates
-                
-                if coordinates:
-                    geocoded_venues += 1
-                    logger.info(f"   ✓ Success: {venue_name} → {coordinates['lat']:.4f}, {coordinates['lng']:.4f}")
-                else:
-                    logger.warning(f"   ✗ Failed: {venue_name}")
-                
-                # Wait between requests to avoid rate limiting
-                if i < len(events) - 1:
-                    await asyncio.sleep(self.request_delay)
-            
-            logger.info(f"   ✓ Completed {date}: {sum(1 for e in events if e.get('location_coordinates'))}/{len(events)} venues geocoded")
-            # Add a small delay between dates as well
-            await asyncio.sleep(self.request_delay)
+            date_geocoded = sum(results[offset:offset + len(events)])
+            offset += len(events)
+            geocoded_venues += date_geocoded
+            logger.info(f"   ✓ Completed {date}: {date_geocoded}/{len(events)} venues geocoded")
         
         logger.info(f"Geocoding complete: {geocoded_venues}/{total_venues} venues geocoded successfully")
-        return results_by_date
+        return results_by_date, ProcessingStats(
+            total_in=total_venues,
+            total_out=total_venues,
+            extras={'geocoded': geocoded_venues}
+        )
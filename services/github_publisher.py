@@ -1,12 +1,12 @@
 """GitHub publishing service"""
 import base64
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional
-import requests
-import pytz
 from config import Config
+from services import http
+from utils import json_utils
 from utils.logger import setup_logger
+from utils.time_utils import TORONTO_TZ
 
 logger = setup_logger(__name__)
 
@@ -19,6 +19,8 @@ class GitHubPublisher:
         self.repo = Config.GITHUB_REPO
         self.file_path = Config.GITHUB_FILE_PATH
         self.base_url = Config.GITHUB_API_BASE
+        # SHA of the file as last published by this process; saves a GET per run
+        self._cached_sha: Optional[str] = None
     
     async def get_current_file_sha(self) -> Optional[str]:
         """
@@ -35,10 +37,10 @@ class GitHubPublisher:
                 'User-Agent': 'DateSpot-Aggregator'
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = await http.get_client().get(url, headers=headers, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_utils.loads(response.content)
                 return data.get('sha')
             elif response.status_code == 404:
                 logger.info("File doesn't exist yet, will create new")
@@ -78,7 +80,7 @@ class GitHubPublisher:
     return res.status(401).json({{ error: 'Unauthorized' }});
   }}
   
-  const schema = {json.dumps(schema, indent=2)};
+  const schema = {json_utils.dumps(schema)};
   
   res.setHeader('Cache-Control', 'public, max-age=3600');
   res.setHeader('Content-Type', 'application/json');
@@ -100,14 +102,18 @@ class GitHubPublisher:
         logger.info("Starting GitHub publication process...")
         
         try:
-            # Get current file SHA
-            logger.info("   🔍 Checking for existing file...")
-            sha = await self.get_current_file_sha()
-            
+            # Get current file SHA, reusing the one from our last publish when we have it
+            sha = self._cached_sha
             if sha:
-                logger.info(f"   ✓ Found existing file with SHA: {sha[:8]}...")
+                logger.info(f"   ✓ Using SHA from last publish: {sha[:8]}...")
             else:
-                logger.info("   ✓ No existing file found, will create new")
+                logger.info("   🔍 Checking for existing file...")
+                sha = await self.get_current_file_sha()
+                
+                if sha:
+                    logger.info(f"   ✓ Found existing file with SHA: {sha[:8]}...")
+                else:
+                    logger.info("   ✓ No existing file found, will create new")
             
             # Prepare the new function code
             logger.info("   📝 Preparing JavaScript function code...")
@@ -118,8 +124,7 @@ class GitHubPublisher:
             encoded_content = base64.b64encode(function_code.encode('utf-8')).decode('utf-8')
             
             # Prepare commit message with Toronto timezone
-            toronto_tz = pytz.timezone('America/Toronto')
-            toronto_time = datetime.now(toronto_tz)
+            toronto_time = datetime.now(TORONTO_TZ)
             commit_message = f"Update schema from DateSpot Aggregator - {toronto_time.isoformat()}"
             
             # Prepare request payload
@@ -142,20 +147,38 @@ class GitHubPublisher:
             }
             
             logger.info(f"   🚀 Publishing to {self.repo}/{self.file_path}...")
-            response = requests.put(
+            response = await http.get_client().put(
                 url,
                 json=payload,
                 headers=headers,
                 timeout=30
             )
+            
+            # The file changed since our last publish; retry once against its current SHA
+            if response.status_code == 409 and self._cached_sha:
+                logger.warning("   ⚠️ File changed since last publish, fetching current SHA and retrying...")
+                self._cached_sha = None
+                sha = await self.get_current_file_sha()
+                if sha:
+                    payload['sha'] = sha
+                else:
+                    payload.pop('sha', None)
+                response = await http.get_client().put(
+                    url,
+                    json=payload,
+                    headers=headers,
+                    timeout=30
+                )
             response.raise_for_status()
             
-            data = response.json()
+            data = json_utils.loads(response.content)
+            self._cached_sha = data.get('content', {}).get('sha')
             commit_sha = data.get('commit', {}).get('sha', 'unknown')
             logger.info(f"   ✓ Successfully published to GitHub")
             logger.info(f"   📊 Commit SHA: {commit_sha}")
             return True
         
         except Exception as error:
+            self._cached_sha = None
             logger.error(f"Error publishing to GitHub: {error}")
             return False
@@ -0,0 +1,37 @@
+"""Shared async HTTP client for the API services"""
+from typing import Optional
+import httpx
+from config import Config
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+    
+    All services share one connection pool so TCP/TLS connections are kept
+    alive and reused across requests instead of being opened per call.
+    
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=httpx.Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT),
+            http2=Config.HTTP2_ENABLED
+        )
+    return _client
+
+
+async def close() -> None:
+    """Close the shared HTTP client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
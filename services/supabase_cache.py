@@ -1,26 +1,79 @@
 """Supabase caching service for DateSpot Aggregator"""
 import asyncio
-from typing import Dict, Optional, Any
+import time
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Any
 from datetime import datetime, timedelta
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from config import Config
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_client: Optional[Client] = None
+
+
+def get_shared_client() -> Client:
+    """
+    Get the process-wide Supabase client, creating it on first use.
+    
+    Every SupabaseCache shares it, so the services reuse one HTTP connection
+    pool instead of each opening their own.
+    
+    Returns:
+        Shared Supabase client
+    """
+    global _client
+    if _client is None:
+        _client = create_client(
+            Config.SUPABASE_URL,
+            Config.SUPABASE_KEY,
+            options=ClientOptions(postgrest_client_timeout=Config.SUPABASE_TIMEOUT)
+        )
+    return _client
+
+
+class GeocodingEntry(NamedTuple):
+    """In-memory geocoding cache entry; expiry is a POSIX timestamp so checks are one comparison"""
+    lat: float
+    lng: float
+    expires_ts: float
+
+
+def _expiry_timestamp(expires_at: str) -> float:
+    """
+    Convert a stored expires_at value to a POSIX timestamp.
+    
+    Args:
+        expires_at: ISO 8601 timestamp as returned by Supabase (may end in 'Z')
+        
+    Returns:
+        Seconds since the epoch
+    """
+    # Python 3.11+ parses the trailing 'Z' and any fractional-second precision
+    return datetime.fromisoformat(expires_at).timestamp()
+
 
 class SupabaseCache:
     """Service for caching API responses in Supabase with in-memory optimization"""
     
     def __init__(self):
-        self.supabase: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+        self.supabase: Client = get_shared_client()
         self.geocoding_ttl_days = Config.GEOCODING_CACHE_TTL_DAYS
         self.categorization_ttl_days = Config.CATEGORIZATION_CACHE_TTL_DAYS
+        self._geocoding_ttl = timedelta(days=self.geocoding_ttl_days)
+        self._categorization_ttl = timedelta(days=self.categorization_ttl_days)
         
         # In-memory caches
-        self._geocoding_cache: Dict[str, Dict[str, Any]] = {}
+        self._geocoding_cache: Dict[str, GeocodingEntry] = {}
         self._categorization_cache: Dict[str, str] = {}
         self._cache_loaded = False
+        
+        # Serializes the first load when many coroutines miss at once
+        self._load_lock = asyncio.Lock()
+        
+        # Geocoding rows waiting for flush(), keyed by normalized venue name
+        self._pending_geocoding: Dict[str, Dict[str, Any]] = {}
     
     def _normalize_venue_name(self, venue_name: str) -> str:
         """
@@ -36,27 +89,79 @@ class SupabaseCache:
             return ""
         return venue_name.strip().lower()
     
+    async def _execute(self, query: Any) -> Any:
+        """
+        Run a Supabase query in a worker thread so the blocking client never stalls the event loop.
+        
+        Args:
+            query: Query builder to execute
+            
+        Returns:
+            The query's API response
+        """
+        return await asyncio.to_thread(query.execute)
+    
     async def _load_cache_if_needed(self) -> None:
         """Load cache data from Supabase into memory if not already loaded"""
         if self._cache_loaded:
             return
+        
+        async with self._load_lock:
+            if not self._cache_loaded:
+                await self._load_cache()
+    
+    async def _select_active_pages(self, table: str, columns: str, key: str, current_time: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Page through a table's unexpired rows.
+        
+        PostgREST caps each response (1000 rows by default on Supabase), so larger
+        tables are read in key order one range at a time until a page comes back empty.
+        
+        Args:
+            table: Cache table name
+            columns: Columns to select
+            key: Unique column to order pages by
+            current_time: ISO timestamp; rows expiring before it are skipped
             
+        Yields:
+            Lists of rows, one per page
+        """
+        start = 0
+        while True:
+            response = await self._execute(
+                self.supabase.table(table).select(columns).gte('expires_at', current_time)
+                .order(key).range(start, start + Config.SUPABASE_PAGE_SIZE - 1)
+            )
+            rows = response.data
+            if not rows:
+                return
+            yield rows
+            start += len(rows)
+    
+    async def _load_geocoding_cache(self, current_time: str) -> None:
+        """Load unexpired geocoding rows into memory page by page"""
+        async for rows in self._select_active_pages('geocoding_cache', 'venue_name, lat, lng, expires_at', 'venue_name', current_time):
+            for row in rows:
+                self._geocoding_cache[row['venue_name']] = GeocodingEntry(
+                    row['lat'], row['lng'], _expiry_timestamp(row['expires_at'])
+                )
+    
+    async def _load_categorization_cache(self, current_time: str) -> None:
+        """Load unexpired categorization rows into memory page by page"""
+        async for rows in self._select_active_pages('categorization_cache', 'event_id, category', 'event_id', current_time):
+            for row in rows:
+                self._categorization_cache[row['event_id']] = row['category']
+    
+    async def _load_cache(self) -> None:
+        """Load both cache tables from Supabase into memory"""
         try:
             current_time = datetime.now().isoformat()
             
-            # Load geocoding cache
-            geocoding_response = self.supabase.table('geocoding_cache').select('venue_name, lat, lng, expires_at').gte('expires_at', current_time).execute()
-            for row in geocoding_response.data:
-                self._geocoding_cache[row['venue_name']] = {
-                    'lat': row['lat'],
-                    'lng': row['lng'],
-                    'expires_at': row['expires_at']
-                }
-            
-            # Load categorization cache
-            categorization_response = self.supabase.table('categorization_cache').select('event_id, category, expires_at').gte('expires_at', current_time).execute()
-            for row in categorization_response.data:
-                self._categorization_cache[row['event_id']] = row['category']
+            # Page through both tables at once
+            await asyncio.gather(
+                self._load_geocoding_cache(current_time),
+                self._load_categorization_cache(current_time)
+            )
             
             self._cache_loaded = True
             logger.info(f"   📥 Loaded cache: {len(self._geocoding_cache)} geocoding entries, {len(self._categorization_cache)} categorization entries")
@@ -65,6 +170,21 @@ class SupabaseCache:
             logger.warning(f"   ⚠️ Error loading cache into memory: {error}")
             self._cache_loaded = True  # Prevent retry loops
     
+    def reset(self) -> None:
+        """
+        Drop the in-memory caches so the next lookup reloads them from Supabase.
+        
+        A long-lived process calls this once per run; in-memory entries are not
+        expiry-checked, so this keeps them in step with the tables' TTLs and cleanup.
+        """
+        self._geocoding_cache = {}
+        self._categorization_cache = {}
+        self._cache_loaded = False
+    
+    async def warmup(self) -> None:
+        """Load the cache tables ahead of the first lookup so it never waits on them"""
+        await self._load_cache_if_needed()
+    
     async def get_geocoding_cache(self, venue_name: str) -> Optional[Dict[str, float]]:
         """
         Get cached geocoding data for a venue.
@@ -82,170 +202,148 @@ class SupabaseCache:
             if not normalized_name:
                 return None
             
-            # Check in-memory cache
-            if normalized_name in self._geocoding_cache:
-                cache_data = self._geocoding_cache[normalized_name]
-                
-                # Check if expired
-                expires_at_str = cache_data['expires_at']
-                if expires_at_str.endswith('Z'):
-                    expires_at_str = expires_at_str[:-1] + '+00:00'
-                expires_at = datetime.fromisoformat(expires_at_str)
-                if expires_at > datetime.now(expires_at.tzinfo):
-                    coordinates = {
-                        'lat': cache_data['lat'],
-                        'lng': cache_data['lng']
-                    }
-                    logger.info(f"   ✓ Cache HIT: Retrieved geocoding from cache for \"{venue_name}\" → {coordinates['lat']:.4f}, {coordinates['lng']:.4f}")
-                    return coordinates
-                else:
-                    # Remove expired entry
-                    del self._geocoding_cache[normalized_name]
+            # Check in-memory cache, skipping expired entries
+            cache_entry = self._geocoding_cache.get(normalized_name)
+            if cache_entry is not None and cache_entry.expires_ts > time.time():
+                coordinates = {
+                    'lat': cache_entry.lat,
+                    'lng': cache_entry.lng
+                }
+                logger.debug("   ✓ Cache HIT: Retrieved geocoding from cache for \"%s\" → %.4f, %.4f", venue_name, cache_entry.lat, cache_entry.lng)
+                return coordinates
+            
+            if cache_entry is not None:
+                # Remove expired entry
+                self._geocoding_cache.pop(normalized_name, None)
             
-            logger.info(f"   ○ Cache MISS: No cached geocoding for \"{venue_name}\"")
+            logger.debug("   ○ Cache MISS: No cached geocoding for \"%s\"", venue_name)
             return None
                 
         except Exception as error:
             logger.warning(f"   ⚠️ Cache error for geocoding \"{venue_name}\": {error}")
             return None
     
-    async def set_geocoding_cache(self, venue_name: str, coordinates: Dict[str, float]) -> bool:
+    def queue_geocoding_cache(self, venue_name: str, coordinates: Dict[str, float]) -> bool:
         """
-        Store geocoding data in cache.
+        Store geocoding data in memory now and in Supabase on the next flush().
         
         Args:
             venue_name: Name of the venue
             coordinates: Dictionary with 'lat' and 'lng' keys
             
         Returns:
-            True if successfully cached, False otherwise
+            True if queued, False if there was nothing to store
         """
+        normalized_name = self._normalize_venue_name(venue_name)
+        if not normalized_name or not coordinates:
+            return False
+        
+        expires_at = datetime.now() + self._geocoding_ttl
+        self._geocoding_cache[normalized_name] = GeocodingEntry(
+            coordinates['lat'], coordinates['lng'], expires_at.timestamp()
+        )
+        self._pending_geocoding[normalized_name] = {
+            'venue_name': normalized_name,
+            'lat': coordinates['lat'],
+            'lng': coordinates['lng'],
+            'expires_at': expires_at.isoformat()
+        }
+        return True
+    
+    async def flush(self) -> int:
+        """
+        Write all queued geocoding rows to Supabase with a single upsert.
+        
+        Returns:
+            Number of rows written
+        """
+        if not self._pending_geocoding:
+            return 0
+        
+        rows = list(self._pending_geocoding.values())
+        self._pending_geocoding = {}
+        
         try:
-            await self._load_cache_if_needed()
-            
-            normalized_name = self._normalize_venue_name(venue_name)
-            if not normalized_name or not coordinates:
-                return False
-            
-            expires_at = datetime.now() + timedelta(days=self.geocoding_ttl_days)
-            expires_at_iso = expires_at.isoformat()
-            
-            # Store in Supabase - try insert first, then update if exists
-            try:
-                response = self.supabase.table('geocoding_cache').insert({
-                    'venue_name': normalized_name,
-                    'lat': coordinates['lat'],
-                    'lng': coordinates['lng'],
-                    'expires_at': expires_at_iso
-                }).execute()
-            except Exception as insert_error:
-                if '23505' in str(insert_error):  # Unique constraint violation
-                    # Update existing record
-                    response = self.supabase.table('geocoding_cache').update({
-                        'lat': coordinates['lat'],
-                        'lng': coordinates['lng'],
-                        'expires_at': expires_at_iso
-                    }).eq('venue_name', normalized_name).execute()
-                else:
-                    raise insert_error
+            response = await self._execute(self.supabase.table('geocoding_cache').upsert(rows, on_conflict='venue_name'))
             
             if response.data:
-                # Also store in memory cache
-                self._geocoding_cache[normalized_name] = {
-                    'lat': coordinates['lat'],
-                    'lng': coordinates['lng'],
-                    'expires_at': expires_at_iso
-                }
-                logger.info(f"   💾 Cache STORE: Saved geocoding for \"{venue_name}\" (expires in {self.geocoding_ttl_days} days)")
-                return True
+                logger.info(f"   💾 Cache STORE: Saved geocoding for {len(rows)} venues (expire in {self.geocoding_ttl_days} days)")
+                return len(rows)
             else:
-                logger.warning(f"   ⚠️ Failed to cache geocoding for \"{venue_name}\"")
-                return False
-                
+                logger.warning(f"   ⚠️ Failed to cache geocoding for {len(rows)} venues")
+                return 0
+        
         except Exception as error:
-            logger.warning(f"   ⚠️ Cache store error for geocoding \"{venue_name}\": {error}")
-            return False
+            logger.warning(f"   ⚠️ Cache store error for bulk geocoding: {error}")
+            return 0
     
-    async def get_categorization_cache(self, event_id: str) -> Optional[str]:
+    async def get_categorization_cache_bulk(self, event_ids: List[str]) -> Dict[str, str]:
         """
-        Get cached categorization data for an event.
+        Get cached categorizations for many events at once.
         
         Args:
-            event_id: ID of the event
+            event_ids: Cache keys to look up
             
         Returns:
-            Category string, or None if not cached/expired
+            Mapping of each cached key to its category; missing keys are omitted
         """
         try:
             await self._load_cache_if_needed()
             
-            if not event_id:
-                return None
-            
-            event_id = str(event_id)  # Ensure string
+            categorization_cache = self._categorization_cache
+            found = {}
+            for event_id in event_ids:
+                category = categorization_cache.get(event_id)
+                if category:
+                    found[event_id] = category
             
-            # Check in-memory cache
-            if event_id in self._categorization_cache:
-                category = self._categorization_cache[event_id]
-                logger.info(f"   ✓ Cache HIT: Retrieved categorization from cache for event {event_id} → \"{category}\"")
-                return category
-            
-            logger.info(f"   ○ Cache MISS: No cached categorization for event {event_id}")
-            return None
-                
+            logger.info(f"   ✓ Cache lookup: {len(found)}/{len(event_ids)} categorization keys found")
+            return found
+        
         except Exception as error:
-            logger.warning(f"   ⚠️ Cache error for categorization event {event_id}: {error}")
-            return None
+            logger.warning(f"   ⚠️ Cache error for bulk categorization lookup: {error}")
+            return {}
     
-    async def set_categorization_cache(self, event_id: str, category: str) -> bool:
+    async def set_categorization_cache_bulk(self, categories: Dict[str, str]) -> int:
         """
-        Store categorization data in cache.
+        Store many categorizations with a single upsert.
         
         Args:
-            event_id: ID of the event
-            category: AI-generated category
+            categories: Mapping of cache key to AI-generated category
             
         Returns:
-            True if successfully cached, False otherwise
+            Number of categorizations stored
         """
+        rows = [
+            {'event_id': event_id, 'category': category}
+            for event_id, category in categories.items()
+            if event_id and category
+        ]
+        if not rows:
+            return 0
+        
         try:
             await self._load_cache_if_needed()
             
-            if not event_id or not category:
-                return False
-            
-            event_id = str(event_id)  # Ensure string
-            expires_at = datetime.now() + timedelta(days=self.categorization_ttl_days)
+            expires_at = (datetime.now() + self._categorization_ttl).isoformat()
+            for row in rows:
+                row['expires_at'] = expires_at
             
-            # Store in Supabase - try insert first, then update if exists
-            try:
-                response = self.supabase.table('categorization_cache').insert({
-                    'event_id': event_id,
-                    'category': category,
-                    'expires_at': expires_at.isoformat()
-                }).execute()
-            except Exception as insert_error:
-                if '23505' in str(insert_error):  # Unique constraint violation
-                    # Update existing record
-                    response = self.supabase.table('categorization_cache').update({
-                        'category': category,
-                        'expires_at': expires_at.isoformat()
-                    }).eq('event_id', event_id).execute()
-                else:
-                    raise insert_error
+            response = await self._execute(self.supabase.table('categorization_cache').upsert(rows, on_conflict='event_id'))
             
             if response.data:
                 # Also store in memory cache
-                self._categorization_cache[event_id] = category
-                logger.info(f"   💾 Cache STORE: Saved categorization for event {event_id} → \"{category}\" (expires in {self.categorization_ttl_days} days)")
-                return True
+                for row in rows:
+                    self._categorization_cache[row['event_id']] = row['category']
+                logger.info(f"   💾 Cache STORE: Saved {len(rows)} categorizations (expire in {self.categorization_ttl_days} days)")
+                return len(rows)
             else:
-                logger.warning(f"   ⚠️ Failed to cache categorization for event {event_id}")
-                return False
-                
+                logger.warning(f"   ⚠️ Failed to cache {len(rows)} categorizations")
+                return 0
+        
         except Exception as error:
-            logger.warning(f"   ⚠️ Cache store error for categorization event {event_id}: {error}")
-            return False
+            logger.warning(f"   ⚠️ Cache store error for bulk categorization: {error}")
+            return 0
     
     async def cleanup_expired_cache(self) -> Dict[str, int]:
         """
@@ -258,11 +356,11 @@ class SupabaseCache:
             current_time = datetime.now().isoformat()
             
             # Clean up expired geocoding cache
-            geocoding_response = self.supabase.table('geocoding_cache').delete().lt('expires_at', current_time).execute()
+            geocoding_response = await self._execute(self.supabase.table('geocoding_cache').delete().lt('expires_at', current_time))
             geocoding_cleaned = len(geocoding_response.data) if geocoding_response.data else 0
             
             # Clean up expired categorization cache
-            categorization_response = self.supabase.table('categorization_cache').delete().lt('expires_at', current_time).execute()
+            categorization_response = await self._execute(self.supabase.table('categorization_cache').delete().lt('expires_at', current_time))
             categorization_cleaned = len(categorization_response.data) if categorization_response.data else 0
             
             cleanup_stats = {
@@ -290,12 +388,13 @@ class SupabaseCache:
         try:
             current_time = datetime.now().isoformat()
             
-            # Count active geocoding cache entries
-            geocoding_count_response = self.supabase.table('geocoding_cache').select('id', count='exact').gte('expires_at', current_time).execute()
+            # Count active entries in both tables at once; the exact count comes back in a
+            # header, so limit(1) keeps the queries from transferring every row's id
+            geocoding_count_response, categorization_count_response = await asyncio.gather(
+                self._execute(self.supabase.table('geocoding_cache').select('id', count='exact').gte('expires_at', current_time).limit(1)),
+                self._execute(self.supabase.table('categorization_cache').select('id', count='exact').gte('expires_at', current_time).limit(1))
+            )
             active_geocoding = geocoding_count_response.count if geocoding_count_response.count is not None else 0
-            
-            # Count active categorization cache entries
-            categorization_count_response = self.supabase.table('categorization_cache').select('id', count='exact').gte('expires_at', current_time).execute()
             active_categorization = categorization_count_response.count if categorization_count_response.count is not None else 0
             
             stats = {
@@ -1,8 +1,9 @@
 """Weather service using Visual Crossing API"""
 import asyncio
 from typing import Dict, List, Any, Optional
-import requests
 from config import Config
+from services import http
+from utils import json_utils
 from utils.time_utils import convert_sunset_to_number
 from utils.logger import setup_logger
 
@@ -15,6 +16,58 @@ class WeatherService:
     def __init__(self):
         self.api_key = Config.WEATHER_API_KEY
         self.base_url = Config.WEATHER_API_BASE
+        self.params = {
+            'key': self.api_key,
+            'elements': 'datetime,tempmax,tempmin,conditions,sunset',
+            'include': 'days',
+            'unitGroup': 'metric'
+        }
+    
+    def _extract_weather(self, day_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the fields we publish from one day of the timeline response.
+        
+        Args:
+            day_data: Day entry from the Visual Crossing response
+            
+        Returns:
+            Weather data dictionary
+        """
+        return {
+            'tempmax': day_data.get('tempmax'),
+            'tempmin': day_data.get('tempmin'),
+            'conditions': day_data.get('conditions'),
+            'sunset': convert_sunset_to_number(day_data.get('sunset'))
+        }
+    
+    async def fetch_weather_for_range(self, start_date: str, end_date: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch weather data for every day in a date range with a single request.
+        
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format
+            
+        Returns:
+            Weather data by date; empty if the request fails
+        """
+        try:
+            url = f"{self.base_url}/Toronto,ON,Canada/{start_date}/{end_date}"
+            logger.info(f"Fetching weather data for {start_date} to {end_date}")
+            
+            response = await http.get_client().get(url, params=self.params, timeout=30)
+            response.raise_for_status()
+            
+            data = json_utils.loads(response.content)
+            return {
+                day_data['datetime']: self._extract_weather(day_data)
+                for day_data in data.get('days') or []
+                if day_data.get('datetime')
+            }
+        
+        except Exception as error:
+            logger.error(f"Error fetching weather for {start_date} to {end_date}: {error}")
+            return {}
     
     async def fetch_weather_for_date(self, date: str) -> Optional[Dict[str, Any]]:
         """
@@ -30,27 +83,14 @@ class WeatherService:
             url = f"{self.base_url}/Toronto,ON,Canada/{date}"
             logger.info(f"Fetching weather data for {date}")
             
-            params = {
-                'key': self.api_key,
-                'elements': 'tempmax,tempmin,conditions,sunset',
-                'include': 'days',
-                'unitGroup': 'metric'
-            }
-            
-            response = requests.get(url, params=params, timeout=30)
+            response = await http.get_client().get(url, params=self.params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_utils.loads(response.content)
             
             # Extract weather data
             if data.get('days') and len(data['days']) > 0:
-                day_data = data['days'][0]
-                weather_info = {
-                    'tempmax': day_data.get('tempmax'),
-                    'tempmin': day_data.get('tempmin'),
-                    'conditions': day_data.get('conditions'),
-                    'sunset': convert_sunset_to_number(day_data.get('sunset'))
-                }
+                weather_info = self._extract_weather(data['days'][0])
                 logger.info(f"Successfully fetched weather for {date}")
                 return weather_info
             else:
@@ -77,15 +117,24 @@ class WeatherService:
         
         dates = list(results_by_date.keys())
         
-        # Fetch weather data for all dates concurrently
-        logger.info(f"   🌐 Fetching weather data for {len(dates)} dates concurrently...")
-        weather_tasks = [self.fetch_weather_for_date(date) for date in dates]
-        weather_results = await asyncio.gather(*weather_tasks)
+        # Fetch the whole date range in one request
+        weather_by_date = {}
+        if dates:
+            logger.info(f"   🌐 Fetching weather data for {len(dates)} dates in one request...")
+            weather_by_date = await self.fetch_weather_for_range(min(dates), max(dates))
+        
+        # Fall back to concurrent per-date requests for anything the range did not cover
+        missing_dates = [date for date in dates if date not in weather_by_date]
+        if missing_dates:
+            logger.info(f"   🌐 Fetching weather data for {len(missing_dates)} dates concurrently...")
+            weather_results = await asyncio.gather(*(self.fetch_weather_for_date(date) for date in missing_dates))
+            weather_by_date.update(zip(missing_dates, weather_results))
         
         # Build weather report by date
         weather_report_by_date = {}
         successful_weather = 0
-        for date, weather_data in zip(dates, weather_results):
+        for date in dates:
+            weather_data = weather_by_date[date]
             weather_report_by_date[date] = weather_data
             if weather_data and not weather_data.get('error'):
                 successful_weather += 1
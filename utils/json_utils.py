@@ -0,0 +1,42 @@
+"""JSON serialization helpers, using orjson when it is installed"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON string or bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,8 +1,45 @@
 """Logging configuration"""
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
+# All loggers hand records to one queue; a background listener thread formats
+# and writes them, so logging never blocks the asyncio event loop on stdout I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+
+
+def _start_listener() -> QueueListener:
+    """Start a listener thread that writes queued records to the console"""
+    listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+_listener = _start_listener()
+atexit.register(_listener.stop)
+
+
+def banner(*lines: str) -> str:
+    """
+    Compose a multi-line banner so it can be logged with a single call.
+    
+    Args:
+        lines: Banner text lines
+        
+    Returns:
+        The lines framed by separator rules, starting on a fresh line
+    """
+    return '\n'.join(('', '=' * 80, *lines, '=' * 80))
+
 
 def setup_logger(name: str = 'datespot_aggregator', level: int = logging.INFO) -> logging.Logger:
     """
@@ -22,18 +59,11 @@ def setup_logger(name: str = 'datespot_aggregator', level: int = logging.INFO) -
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
+    # Hand records to the shared queue; the listener thread does the console output
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.setLevel(level)
     
     # Add handler to logger
-    logger.addHandler(console_handler)
+    logger.addHandler(queue_handler)
     
     return logger
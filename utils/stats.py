@@ -0,0 +1,12 @@
+"""Processing statistics shared by workflow stages"""
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class ProcessingStats:
+    """Counters a workflow stage collects while processing events"""
+
+    total_in: int = 0
+    total_out: int = 0
+    extras: Dict[str, int] = field(default_factory=dict)
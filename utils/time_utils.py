@@ -1,9 +1,16 @@
 """Time conversion utilities"""
 import re
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
+# Event dates, schedules and published timestamps all use Toronto local time
+TORONTO_TZ = ZoneInfo('America/Toronto')
 
-def convert_to_numerical_time(time_string: str) -> Optional[int]:
+# "9:30 PM" / "11:00 AM" / "9 PM": hours, optional minutes, period
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM)')
+
+def convert_to_numerical_time(time_string: Optional[str]) -> Optional[int]:
     """
     Convert time string to 24-hour numerical format.
     
@@ -17,40 +24,27 @@ def convert_to_numerical_time(time_string: str) -> Optional[int]:
     if not time_string or not isinstance(time_string, str):
         return None
     
+    return _parse_time(time_string)
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time_string: str) -> Optional[int]:
+    """Parse one time string; memoized because events share a small set of start/end times"""
     # Remove any extra whitespace and convert to uppercase
-    clean_time = time_string.strip().upper()
-    
-    # Extract time parts using regex to handle various formats
-    time_match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)|(\d{1,2})\s*(AM|PM)', clean_time)
+    time_match = _TIME_RE.match(time_string.strip().upper())
     
     if not time_match:
         return None
     
-    hours = 0
-    minutes = 0
+    hours_text, minutes_text, period = time_match.groups()
+    hours = int(hours_text)
+    minutes = int(minutes_text) if minutes_text else 0
     
-    if time_match.group(1):
-        # Format: "9:30 PM" or "11:00 AM"
-        hours = int(time_match.group(1))
-        minutes = int(time_match.group(2))
-        period = time_match.group(3)
-        
-        # Convert to 24-hour format
-        if period == 'PM' and hours != 12:
-            hours += 12
-        elif period == 'AM' and hours == 12:
-            hours = 0
-    elif time_match.group(4):
-        # Format: "9 PM" or "11 AM"
-        hours = int(time_match.group(4))
-        minutes = 0
-        period = time_match.group(5)
-        
-        # Convert to 24-hour format
-        if period == 'PM' and hours != 12:
-            hours += 12
-        elif period == 'AM' and hours == 12:
-            hours = 0
+    # Convert to 24-hour format
+    if period == 'PM' and hours != 12:
+        hours += 12
+    elif period == 'AM' and hours == 12:
+        hours = 0
     
     # Return as 4-digit number (HHMM format)
     return hours * 100 + minutes
@@ -69,16 +63,15 @@ def convert_sunset_to_number(sunset_string: str) -> Optional[int]:
     if not sunset_string:
         return None
     
-    # Parse the time string (format: "HH:MM:SS")
-    time_parts = sunset_string.split(':')
-    if len(time_parts) < 2:
-        return None
-    
     try:
-        hours = int(time_parts[0])
-        minutes = int(time_parts[1])
+        # Visual Crossing sends zero-padded "HH:MM:SS", so slice the digits directly
+        if len(sunset_string) >= 5 and sunset_string[2] == ':':
+            return int(sunset_string[0:2]) * 100 + int(sunset_string[3:5])
         
-        # Convert to 4-digit number (HHMM format)
-        return hours * 100 + minutes
-    except (ValueError, IndexError):
+        # Anything else (e.g. "7:05:00") goes through the general parse
+        time_parts = sunset_string.split(':')
+        if len(time_parts) < 2:
+            return None
+        return int(time_parts[0]) * 100 + int(time_parts[1])
+    except (ValueError, TypeError):
         return None